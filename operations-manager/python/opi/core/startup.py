@@ -33,6 +33,7 @@ from opi.core.keycloak_client_startup import ensure_keycloak_credentials
 from opi.manager.project_manager import ProjectManager, create_project_manager
 from opi.services.project_service import get_project_service, initialize_project_service
 from opi.services.user_service import get_user_service
+from opi.utils.naming import prewarm_naming_cache
 
 logger = logging.getLogger(__name__)
 
@@ -432,6 +433,14 @@ async def run_startup_tasks(app: FastAPI) -> bool:
                 project_service.register(
                     project_name, api_key, project_file_base_name, project_data.get("users", []), project_data
                 )
+
+                # Prime naming caches with this project's deployments and clusters
+                deployments = project_data.get("deployments", [])
+                prewarm_naming_cache(
+                    [project_name],
+                    [deployment["name"] for deployment in deployments if deployment.get("name")],
+                    {deployment["cluster"] for deployment in deployments if deployment.get("cluster")},
+                )
             except Exception as e:
                 logger.error(f"Error processing project file {project_file}: {e}")
             finally:
@@ -3,6 +3,7 @@ Simple task tracking for FastAPI BackgroundTasks.
 """
 
 # TODO: make the task manager actually add and finish tasks where they are created and done
+import asyncio
 import logging
 import time
 import uuid
@@ -56,11 +57,45 @@ class ProjectInfo:
     namespace: str | None = None
     web_addresses: dict[str, str] | None = None  # component_name -> web_address
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Every field assignment is a state change the progress stream should push
+        object.__setattr__(self, name, value)
+        notify_project_changed(self.id)
+
 
 # Simple in-memory storage for projects only
 _projects: dict[str, ProjectInfo] = {}
 # Store TaskProgressManager instances per project
 _project_managers: dict[str, "TaskProgressManager"] = {}
+# Events of the progress streams currently watching each project
+_project_listeners: dict[str, set[asyncio.Event]] = {}
+
+
+def notify_project_changed(project_id: str) -> None:
+    """Wake up every progress stream watching the given project."""
+    for event in _project_listeners.get(project_id, ()):
+        event.set()
+
+
+def watch_project(project_id: str) -> asyncio.Event:
+    """
+    Register a listener for changes to a project.
+
+    Returns:
+        Event that is set whenever the project's progress changes; pass it to unwatch_project when done
+    """
+    event = asyncio.Event()
+    _project_listeners.setdefault(project_id, set()).add(event)
+    return event
+
+
+def unwatch_project(project_id: str, event: asyncio.Event) -> None:
+    """Remove a listener registered with watch_project."""
+    listeners = _project_listeners.get(project_id)
+    if listeners is not None:
+        listeners.discard(event)
+        if not listeners:
+            del _project_listeners[project_id]
 
 
 class TaskProgressManager:
@@ -70,6 +105,10 @@ class TaskProgressManager:
         self.project_id = project_id
         self.project_name = project_name
         self.tasks: dict[str, Task] = {}  # Local tasks for this project only
+        # Progress page view of the tasks, kept up to date as tasks change instead of rebuilt per poll
+        self._hierarchy: list[dict[str, Any]] = []  # main tasks, each with its subtasks
+        self._task_entries: dict[str, dict[str, Any]] = {}  # task_id -> its entry in the hierarchy
+        self._completed_count = 0
 
         # Create project info
         _projects[project_id] = ProjectInfo(
@@ -85,6 +124,9 @@ class TaskProgressManager:
         task_id = str(uuid.uuid4())
         task = Task(id=task_id, name=name, status=TaskStatus.RUNNING)
         self.tasks[task_id] = task
+        entry = {**self._task_entry(task), "subtasks": []}
+        self._task_entries[task_id] = entry
+        self._hierarchy.append(entry)
         logger.info(f"Project {self.project_id}: Added task: {name} ({task_id})")
         self.update_current_step(name)
         return task_id
@@ -94,6 +136,12 @@ class TaskProgressManager:
         subtask_id = str(uuid.uuid4())
         subtask = Task(id=subtask_id, name=name, status=TaskStatus.RUNNING, parent_id=parent_task_id)
         self.tasks[subtask_id] = subtask
+        entry = self._task_entry(subtask)
+        self._task_entries[subtask_id] = entry
+        # Only main tasks list their subtasks; deeper nesting is not shown on the progress page
+        parent_entry = self._task_entries.get(parent_task_id)
+        if parent_entry is not None and "subtasks" in parent_entry:
+            parent_entry["subtasks"].append(entry)
         logger.info(f"Project {self.project_id}: Added subtask: {name} ({subtask_id}) under {parent_task_id}")
         self.update_current_step(name)
         return subtask_id
@@ -101,18 +149,59 @@ class TaskProgressManager:
     def complete_task(self, task_id: str) -> None:
         """Mark a task as completed."""
         if task_id in self.tasks:
-            self.tasks[task_id].status = TaskStatus.COMPLETED
+            self._set_task_status(self.tasks[task_id], TaskStatus.COMPLETED)
             self.tasks[task_id].completed_at = datetime.now()
+            self._task_entries[task_id]["completed_at"] = self.tasks[task_id].completed_at.isoformat()
+            notify_project_changed(self.project_id)
             logger.info(f"Project {self.project_id}: Completed task: {self.tasks[task_id].name} ({task_id})")
 
     def fail_task(self, task_id: str, error: str) -> None:
         """Mark a task as failed."""
         if task_id in self.tasks:
-            self.tasks[task_id].status = TaskStatus.FAILED
+            self._set_task_status(self.tasks[task_id], TaskStatus.FAILED)
             self.tasks[task_id].error = error
             self.tasks[task_id].completed_at = datetime.now()
+            self._task_entries[task_id]["error"] = error
+            self._task_entries[task_id]["completed_at"] = self.tasks[task_id].completed_at.isoformat()
+            notify_project_changed(self.project_id)
             logger.error(f"Project {self.project_id}: Failed task: {self.tasks[task_id].name} ({task_id}): {error}")
 
+    def hierarchy_snapshot(self) -> list[dict[str, Any]]:
+        """
+        Get the tasks as shown on the progress page.
+
+        The list is maintained in place as tasks change; callers must treat it as read-only.
+
+        Returns:
+            Main tasks in creation order, each with a "subtasks" list
+        """
+        return self._hierarchy
+
+    def progress_percent(self) -> int:
+        """Get the share of completed tasks, as a whole percentage."""
+        total_tasks = len(self.tasks)
+        return int(self._completed_count / total_tasks * 100) if total_tasks > 0 else 0
+
+    @staticmethod
+    def _task_entry(task: Task) -> dict[str, Any]:
+        return {
+            "id": task.id,
+            "name": task.name,
+            "status": task.status.value,
+            "created_at": task.created_at.isoformat(),
+            "completed_at": task.completed_at.isoformat() if task.completed_at else None,
+            "error": task.error,
+        }
+
+    def _set_task_status(self, task: Task, status: TaskStatus) -> None:
+        if task.status != status:
+            if task.status == TaskStatus.COMPLETED:
+                self._completed_count -= 1
+            elif status == TaskStatus.COMPLETED:
+                self._completed_count += 1
+        task.status = status
+        self._task_entries[task.id]["status"] = status.value
+
     def update_current_step(self, step: str) -> None:
         """Update the current step for the project."""
         if self.project_id in _projects:
@@ -181,6 +270,7 @@ class TaskProgressManager:
             if _projects[self.project_id].web_addresses is None:
                 _projects[self.project_id].web_addresses = {}
             _projects[self.project_id].web_addresses[component_name] = web_address
+            notify_project_changed(self.project_id)
             logger.info(f"Project {self.project_id}: Updated web address for {component_name}: {web_address}")
         # Also call the legacy function for compatibility
         update_component_web_address(self.project_id, component_name, web_address)
@@ -4,11 +4,18 @@ Template system configuration for Operations Manager.
 This module sets up Jinja2 templates with ROOS components for the operations-manager UI.
 """
 
+import logging
+from functools import lru_cache
 from pathlib import Path
 
 from fastapi.templating import Jinja2Templates
+from jinja2 import TemplateError
 from jinja_roos_components import setup_components
 
+from opi.core.config import settings
+
+logger = logging.getLogger(__name__)
+
 # Get the opi package directory (operations-manager/python/opi)
 OPI_DIR = Path(__file__).parent.parent
 TEMPLATES_DIR = OPI_DIR / "templates"
@@ -32,6 +39,10 @@ setup_components(
 # Add global variables that components might need
 templates.env.globals["roos_assets_base_url"] = "/static/roos/dist/"
 
+# Templates only change on disk during development; elsewhere skip the mtime check Jinja does on
+# every cached template lookup
+templates.env.auto_reload = settings.DEBUG
+
 
 def setup_templates() -> Jinja2Templates:
     """
@@ -53,3 +64,55 @@ def get_templates() -> Jinja2Templates:
         Jinja2Templates instance with ROOS components
     """
     return templates
+
+
+def warm_templates() -> None:
+    """
+    Compile the operations-manager page templates into the environment's cache.
+
+    Called during startup so the first request for each page does not pay for parsing and
+    compiling it. Templates that fail to compile are logged and left for the request that
+    renders them to report.
+    """
+    compiled = 0
+    for path in sorted(TEMPLATES_DIR.glob("*.j2")):
+        try:
+            templates.env.get_template(path.name)
+            compiled += 1
+        except TemplateError as e:
+            logger.warning(f"Could not precompile template {path.name}: {e}")
+
+    logger.info(f"Precompiled {compiled} templates")
+
+
+@lru_cache(maxsize=64)
+def _source_lines(source: str) -> tuple[str, ...]:
+    return tuple(source.splitlines())
+
+
+def format_template_error(e: Exception) -> str:
+    """
+    Describe a template rendering error for an error response.
+
+    Jinja2 errors carry the line number and, for syntax errors, the template source; when present
+    the offending source line is appended. Split sources are cached, so repeated failures of the
+    same template do not split it again.
+
+    Args:
+        e: The exception raised while rendering
+
+    Returns:
+        The error message, prefixed with the template line number when known
+    """
+    error_msg = str(e)
+    lineno = getattr(e, "lineno", None)
+    if lineno is None:
+        return error_msg
+
+    error_msg = f"Line {lineno}: {error_msg}"
+    source = getattr(e, "source", None)
+    if source:
+        lines = _source_lines(source)
+        if 0 < lineno <= len(lines):
+            error_msg += f"\nSource: {lines[lineno - 1].strip()}"
+    return error_msg
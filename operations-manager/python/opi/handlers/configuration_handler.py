@@ -9,6 +9,7 @@ project processing and can serialize it to YAML for overview and reference.
 
 import logging
 from dataclasses import dataclass, field
+from io import StringIO
 from typing import Any
 
 from ruamel.yaml import YAML
@@ -475,7 +476,6 @@ class ConfigurationHandler:
         yaml.default_flow_style = False
         yaml.preserve_quotes = True
         yaml.width = 4096
-        from io import StringIO
 
         stream = StringIO()
         yaml.dump(config, stream)
@@ -11,6 +11,7 @@ This module provides functionality for:
 import asyncio
 import logging
 import os
+import re
 import tempfile
 from typing import Any
 
@@ -19,6 +20,10 @@ from opi.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Lines of age-keygen output carrying the generated keys
+_AGE_SECRET_KEY_RE = re.compile(r"^\s*(AGE-SECRET-KEY-\S+)", re.MULTILINE)
+_AGE_PUBLIC_KEY_RE = re.compile(r"^\s*# public key: (age\S+)", re.MULTILINE)
+
 
 # TODO: maybe this handler has to go.. it conflicts with the utils/sops.py
 class SopsHandler:
@@ -62,20 +67,15 @@ class SopsHandler:
                 raise RuntimeError(f"Failed to generate age key pair: {result.stderr}")
 
             # Parse the output to extract private and public keys
-            output_lines = result.stdout.strip().split("\n")
-            private_key = None
-            public_key = None
-
-            for line in output_lines:
-                line = line.strip()
-                if line.startswith("AGE-SECRET-KEY-"):
-                    private_key = line
-                elif line.startswith("# public key: age"):
-                    public_key = line.replace("# public key: ", "")
+            private_match = _AGE_SECRET_KEY_RE.search(result.stdout)
+            public_match = _AGE_PUBLIC_KEY_RE.search(result.stdout)
 
-            if not private_key or not public_key:
+            if not private_match or not public_match:
                 raise RuntimeError("Failed to parse generated age key pair")
 
+            private_key = private_match.group(1)
+            public_key = public_match.group(1)
+
             self.logger.info("Successfully generated age key pair")
             self.logger.debug(f"Public key: {public_key}")
 
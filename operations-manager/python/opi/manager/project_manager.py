@@ -69,7 +69,7 @@ from opi.utils.secrets import BaseSecret, DatabaseSecret, KeycloakSecret, MinIOS
 
 # TypeVar for generic secret types
 T = TypeVar("T", bound=BaseSecret)
-from opi.utils.sops import encrypt_to_sops_files
+from opi.utils.sops import encrypt_to_sops_files_async
 from opi.utils.yaml_util import find_value_by_jsonpath, load_yaml_from_path, save_yaml_to_path, update_value_by_jsonpath
 
 logger = logging.getLogger(__name__)
@@ -990,7 +990,7 @@ class ProjectManager:
             created_files.append(manifest_path)
             logger.info(f"Successfully created repository manifest: {os.path.basename(manifest_path)}")
 
-        encrypt_to_sops_files(project_dir, cast(str, settings.SOPS_AGE_PUBLIC_KEY))
+        await encrypt_to_sops_files_async(project_dir, cast(str, settings.SOPS_AGE_PUBLIC_KEY))
 
     async def _create_argocd_app_project(self) -> None:
         project_data = await self.get_contents()
@@ -1655,7 +1655,7 @@ class ProjectManager:
         for file_path in to_sops_files:
             logger.info(f"  - {os.path.basename(file_path)}")
 
-        encrypt_to_sops_files(target_path, public_key)
+        await encrypt_to_sops_files_async(target_path, public_key)
 
         # Verify all files were encrypted
         remaining_to_sops_files = glob.glob(to_sops_pattern)
@@ -18,6 +18,7 @@ from opi.core.database_pools import close_database_pools
 from opi.core.early_logging import initialize_logging  # noqa: F401
 from opi.core.git_monitor import start_git_monitoring, stop_git_monitoring
 from opi.core.startup import run_startup_tasks
+from opi.core.templates import warm_templates
 from opi.middleware.authorization import AuthorizationMiddleware
 from opi.web.router import web_router
 
@@ -36,6 +37,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     logger.info(f"Starting {PROJECT_NAME} version {VERSION}")
     # logger.info(f"Settings: {mask.secrets(get_settings().model_dump())}")
 
+    # Compile page templates up front so first page loads are not slowed down by it
+    try:
+        warm_templates()
+    except Exception as e:
+        logger.error(f"Error precompiling templates: {e}")
+
     # Run startup tasks (namespace creation, SOPS secrets, etc.)
     try:
         await run_startup_tasks(app)
@@ -11,7 +11,7 @@ This service provides centralized management of projects including:
 import logging
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 from opi.core.config import settings
 
@@ -35,6 +35,26 @@ class Project(BaseModel):
     users: list[ProjectUser] | None = None
     data: dict[str, Any] | None = None  # Full project YAML data
 
+    # Lower-cased email -> role, built once when the project is registered
+    _roles: dict[str, str] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, context: Any) -> None:
+        """Build the role lookup from the project users; the first entry for an email wins."""
+        for user in self.users or []:
+            self._roles.setdefault(user.email.lower(), user.role)
+
+    def role_for(self, user_email: str) -> str | None:
+        """
+        Get a user's role in this project.
+
+        Args:
+            user_email: The user's email address
+
+        Returns:
+            User's role if the user belongs to the project, None otherwise
+        """
+        return self._roles.get(user_email.lower())
+
 
 class ProjectService:
     """Service for managing project mappings."""
@@ -254,19 +274,34 @@ class ProjectService:
         Returns:
             True if user is authorized, False otherwise
         """
-        users = self.get_project_users(project_name)
-        if not users:
-            logger.debug(f"No users found for project: {project_name}")
-            return False
-
-        for user in users:
-            if user.email.lower() == user_email.lower():
-                logger.debug(f"User {user_email} authorized for project {project_name} with role: {user.role}")
-                return True
+        project = self._projects.get(project_name)
+        role = project.role_for(user_email) if project else None
+        if role is not None:
+            logger.debug(f"User {user_email} authorized for project {project_name} with role: {role}")
+            return True
 
         logger.debug(f"User {user_email} not authorized for project: {project_name}")
         return False
 
+    def get_projects_for_user(self, user_email: str) -> list[tuple[Project, str]]:
+        """
+        Get all projects a user belongs to, with the user's role in each.
+
+        Args:
+            user_email: The user's email address
+
+        Returns:
+            List of (project, role) pairs in registration order
+        """
+        user_projects = []
+        for project in self._projects.values():
+            role = project.role_for(user_email)
+            if role is not None:
+                user_projects.append((project, role))
+
+        logger.debug(f"Found {len(user_projects)} projects for user {user_email}")
+        return user_projects
+
     def get_user_role_for_project(self, project_name: str, user_email: str) -> str | None:
         """
         Get a user's role for a specific project.
@@ -278,17 +313,13 @@ class ProjectService:
         Returns:
             User's role if found, None otherwise
         """
-        users = self.get_project_users(project_name)
-        if not users:
-            return None
-
-        for user in users:
-            if user.email.lower() == user_email.lower():
-                logger.debug(f"Found role {user.role} for user {user_email} in project: {project_name}")
-                return user.role
-
-        logger.debug(f"No role found for user {user_email} in project: {project_name}")
-        return None
+        project = self._projects.get(project_name)
+        role = project.role_for(user_email) if project else None
+        if role is not None:
+            logger.debug(f"Found role {role} for user {user_email} in project: {project_name}")
+        else:
+            logger.debug(f"No role found for user {user_email} in project: {project_name}")
+        return role
 
 
 def get_project_service() -> ProjectService:
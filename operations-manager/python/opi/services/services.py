@@ -6,6 +6,7 @@ the entire application, from form submission to project processing.
 """
 
 import logging
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, ClassVar
@@ -296,13 +297,13 @@ class ServiceAdapter:
         return [service for service in services if cls.is_deployment_service(service)]
 
     @classmethod
-    def get_storage_services(cls, services: list[ServiceType]) -> list[ServiceType]:
+    def get_storage_services(cls, services: Sequence[ServiceType]) -> list[ServiceType]:
         """Filter services to only include storage services."""
         storage_services = [ServiceType.PERSISTENT_STORAGE, ServiceType.TEMP_STORAGE]
         return [service for service in services if service in storage_services]
 
     @classmethod
-    def create_storage_configs(cls, services: list[ServiceType]) -> list[dict[str, Any]]:
+    def create_storage_configs(cls, services: Sequence[ServiceType]) -> list[dict[str, Any]]:
         """Create storage configurations for the given services."""
         storage_configs: list[dict[str, Any]] = []
         for service in cls.get_storage_services(services):
@@ -4,14 +4,43 @@ Age encryption/decryption utilities.
 
 import asyncio
 import base64
+import hashlib
 import logging
 import subprocess
+from collections import OrderedDict
 from typing import cast
 
 from opi.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Decrypted content by digest of (private key, ciphertext), most recently used last. Age decryption is
+# deterministic, so an entry can never go stale; changed ciphertexts simply get a new entry
+_DECRYPT_CACHE_SIZE = 256
+_decrypt_cache: OrderedDict[bytes, str] = OrderedDict()
+
+
+def _decrypt_cache_key(encrypted_content: str, private_key: str) -> bytes:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(private_key.encode())
+    digest.update(b"\0")
+    digest.update(encrypted_content.encode())
+    return digest.digest()
+
+
+def _get_cached_decryption(cache_key: bytes) -> str | None:
+    decrypted = _decrypt_cache.get(cache_key)
+    if decrypted is not None:
+        _decrypt_cache.move_to_end(cache_key)
+    return decrypted
+
+
+def _cache_decryption(cache_key: bytes, decrypted: str) -> None:
+    _decrypt_cache[cache_key] = decrypted
+    _decrypt_cache.move_to_end(cache_key)
+    if len(_decrypt_cache) > _DECRYPT_CACHE_SIZE:
+        _decrypt_cache.popitem(last=False)
+
 
 # TODO: replace this method with direct configuration value
 def get_global_private_key() -> str:
@@ -32,6 +61,11 @@ async def decrypt_age_content(encrypted_content: str, private_key: str) -> str:
     if not encrypted_content or not private_key:
         raise ValueError("Missing encrypted content or private key for decryption")
 
+    cache_key = _decrypt_cache_key(encrypted_content, private_key)
+    cached = _get_cached_decryption(cache_key)
+    if cached is not None:
+        return cached
+
     cmd = ["bash", "-c", f'echo "{encrypted_content}" | age -d -i <(echo "{private_key}")']
 
     process = await asyncio.create_subprocess_exec(*cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
@@ -43,7 +77,9 @@ async def decrypt_age_content(encrypted_content: str, private_key: str) -> str:
         logger.error(f"Age decryption failed: {error_msg}")
         raise Exception(f"Age decryption failed: {error_msg}")
 
-    return stdout.decode("utf-8").strip()
+    decrypted_content = stdout.decode("utf-8").strip()
+    _cache_decryption(cache_key, decrypted_content)
+    return decrypted_content
 
 
 async def _encrypt_with_age_and_base64encode_as_prefixed_string(client_secret: str, public_key: str | None) -> str:
@@ -6,14 +6,93 @@ including storage paths, service discovery, database connections, and other runt
 configuration variables.
 """
 
+import io
 import logging
 import re
+import string
+from collections.abc import Callable, Iterator
+from functools import lru_cache
+from itertools import dropwhile, islice
+from typing import Any
 
-from ruamel.yaml import YAML
+from ruamel.yaml import YAML, YAMLError
 from ruamel.yaml.comments import CommentedMap
 
 logger = logging.getLogger(__name__)
 
+# Conversion of YAML scalar values to environment variable strings, keyed by type.
+# Subclasses produced by ruamel's round-trip loader (e.g. DoubleQuotedScalarString,
+# ScalarFloat) are resolved through their MRO in _get_yaml_value_converter.
+_YAML_VALUE_CONVERTERS: dict[type, Callable[[Any], str]] = {
+    type(None): lambda value: "",
+    bool: lambda value: "true" if value else "false",
+    int: str,
+    float: str,
+    str: lambda value: value,
+}
+
+
+def _get_yaml_value_converter(value: Any) -> Callable[[Any], str] | None:
+    """
+    Look up the string converter for a YAML scalar value.
+
+    Args:
+        value: Value loaded from YAML
+
+    Returns:
+        Converter function, or None if the value type is not supported
+    """
+    value_type = type(value)
+    converter = _YAML_VALUE_CONVERTERS.get(value_type)
+    if converter is None:
+        for base in value_type.__mro__[1:]:
+            converter = _YAML_VALUE_CONVERTERS.get(base)
+            if converter is not None:
+                break
+    return converter
+
+
+# Character classes used by _detect_env_var_format to recognise key prefixes
+_YAML_KEY_START_CHARS = frozenset(string.ascii_letters + "_")
+_YAML_KEY_CHARS = frozenset(string.ascii_letters + string.digits + "_")
+_ENV_KEY_START_CHARS = frozenset(string.ascii_uppercase + "_")
+_ENV_KEY_CHARS = frozenset(string.ascii_uppercase + string.digits + "_")
+
+
+def _scan_key(line: str, start_chars: frozenset[str], key_chars: frozenset[str]) -> int:
+    """
+    Scan a key at the start of a line.
+
+    Args:
+        line: Line to scan
+        start_chars: Characters allowed as the first key character
+        key_chars: Characters allowed in the rest of the key
+
+    Returns:
+        Length of the key prefix, or 0 if the line does not start with a key
+    """
+    if not line or line[0] not in start_chars:
+        return 0
+    end = 1
+    length = len(line)
+    while end < length and line[end] in key_chars:
+        end += 1
+    return end
+
+
+def _iter_lines(text: str) -> Iterator[str]:
+    """
+    Lazily iterate over the lines of text, skipping leading blank lines.
+
+    Args:
+        text: Input text
+
+    Returns:
+        Iterator over lines (including line endings), equivalent to text.strip().split("\n")
+        without materializing the full list
+    """
+    return dropwhile(str.isspace, io.StringIO(text))
+
 
 def _detect_env_var_format(text: str) -> str:
     """
@@ -25,35 +104,44 @@ def _detect_env_var_format(text: str) -> str:
     Returns:
         'yaml' if YAML format detected, 'keyvalue' otherwise
     """
-    lines = text.strip().split("\n")
-
     # Look for YAML indicators
     yaml_indicators = 0
     keyvalue_indicators = 0
+    first_line = ""
 
-    for line in lines[:10]:  # Check first 10 lines
-        line = line.strip()
+    for line_num, raw_line in enumerate(islice(_iter_lines(text), 10)):  # Check first 10 lines
+        if line_num == 0:
+            first_line = raw_line.lstrip()
+        line = raw_line.strip()
         if not line or line.startswith("#"):
             continue
 
         # YAML indicators: indentation with colon, no equals sign
         if ":" in line and "=" not in line:
-            # Check for YAML-style key: value
-            if re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*:\s*.+", line):
+            # Check for YAML-style key: value (non-empty value after the colon)
+            key_end = _scan_key(line, _YAML_KEY_START_CHARS, _YAML_KEY_CHARS)
+            if key_end and line[key_end : key_end + 1] == ":" and len(line) > key_end + 1:
                 yaml_indicators += 1
 
         # KEY=VALUE indicators
         if "=" in line and not line.startswith("-"):
-            if re.match(r"^[A-Z_][A-Z0-9_]*=.*", line):
+            key_end = _scan_key(line, _ENV_KEY_START_CHARS, _ENV_KEY_CHARS)
+            if key_end and line[key_end : key_end + 1] == "=":
                 keyvalue_indicators += 1
 
     # If we have more YAML indicators or the text starts with certain patterns
-    if yaml_indicators > keyvalue_indicators or text.strip().startswith(("---", "{\n", "[\n")):
+    if yaml_indicators > keyvalue_indicators or first_line.startswith(("---", "{\n", "[\n")):
         return "yaml"
 
     return "keyvalue"
 
 
+@lru_cache(maxsize=1024)
+def _detect_env_var_format_cached(text: str) -> str:
+    """Cached variant of _detect_env_var_format for repeated inputs."""
+    return _detect_env_var_format(text)
+
+
 def _parse_yaml_env_vars(yaml_text: str) -> dict[str, str]:
     """
     Parse environment variables from YAML format.
@@ -67,51 +155,53 @@ def _parse_yaml_env_vars(yaml_text: str) -> dict[str, str]:
     Raises:
         ValueError: If YAML is invalid or contains non-string values
     """
+    yaml = YAML()
+    yaml.preserve_quotes = True
     try:
-        yaml = YAML()
-        yaml.preserve_quotes = True
         data = yaml.load(yaml_text)
+    except YAMLError as e:
+        raise ValueError(f"Failed to parse YAML: {e!s}") from e
 
-        if data is None:
-            return {}
-
-        # Handle different YAML structures
-        env_vars = {}
-
-        if isinstance(data, dict):
-            for key, value in data.items():
-                if not isinstance(key, str):
-                    raise ValueError(f"Environment variable key must be a string, got {type(key).__name__}: {key}")
-
-                # Validate key format
-                if not re.match(r"^[A-Za-z_][A-Za-z0-9_]*$", key):
-                    raise ValueError(
-                        f"Invalid key format '{key}'. Keys must start with A-Z, a-z, or _, contain only A-Z, a-z, 0-9, _"
-                    )
-
-                # Convert value to string
-                if value is None:
-                    env_vars[key] = ""
-                elif isinstance(value, bool):
-                    env_vars[key] = "true" if value else "false"
-                elif isinstance(value, (int, float)):
-                    env_vars[key] = str(value)
-                elif isinstance(value, str):
-                    env_vars[key] = value
-                else:
-                    raise ValueError(
-                        f"Environment variable '{key}' has unsupported value type {type(value).__name__}. "
-                        "Only strings, numbers, and booleans are supported."
-                    )
-        else:
-            raise ValueError("YAML must be a dictionary/mapping of key-value pairs")
-
-        return env_vars
-
-    except Exception as e:
-        if "ValueError" in str(e.__class__):
-            raise
-        raise ValueError(f"Failed to parse YAML: {e!s}")
+    if data is None:
+        return {}
+
+    # Handle different YAML structures
+    env_vars = {}
+
+    if isinstance(data, dict):
+        for key, value in data.items():
+            if not isinstance(key, str):
+                raise ValueError(f"Environment variable key must be a string, got {type(key).__name__}: {key}")
+
+            # Validate key format
+            if not re.match(r"^[A-Za-z_][A-Za-z0-9_]*$", key):
+                raise ValueError(
+                    f"Invalid key format '{key}'. Keys must start with A-Z, a-z, or _, contain only A-Z, a-z, 0-9, _"
+                )
+
+            # Convert value to string
+            converter = _get_yaml_value_converter(value)
+            if converter is None:
+                raise ValueError(
+                    f"Environment variable '{key}' has unsupported value type {type(value).__name__}. "
+                    "Only strings, numbers, and booleans are supported."
+                )
+            env_vars[key] = converter(value)
+    else:
+        raise ValueError("YAML must be a dictionary/mapping of key-value pairs")
+
+    return env_vars
+
+
+@lru_cache(maxsize=256)
+def _parse_yaml_env_vars_cached(yaml_text: str) -> tuple[tuple[str, str], ...]:
+    """
+    Cached variant of _parse_yaml_env_vars for repeated inputs.
+
+    Returns an immutable tuple of (key, value) pairs so cached results cannot be
+    modified by callers. Invalid input raises ValueError and is not cached.
+    """
+    return tuple(_parse_yaml_env_vars(yaml_text).items())
 
 
 def validate_and_parse_env_vars(env_vars_text: str | None) -> dict[str, str]:
@@ -149,16 +239,15 @@ def validate_and_parse_env_vars(env_vars_text: str | None) -> dict[str, str]:
         return dict(env_vars_text)
 
     # Auto-detect format
-    format_type = _detect_env_var_format(env_vars_text)
+    format_type = _detect_env_var_format_cached(env_vars_text)
 
     if format_type == "yaml":
-        return _parse_yaml_env_vars(env_vars_text)
+        return dict(_parse_yaml_env_vars_cached(env_vars_text))
 
     # Original KEY=VALUE parsing logic
     env_vars = {}
-    lines = env_vars_text.strip().split("\n")
 
-    for line_num, line in enumerate(lines, 1):
+    for line_num, line in enumerate(_iter_lines(env_vars_text), 1):
         line = line.strip()
         if not line or line.startswith("#"):  # Skip empty lines and comments
             continue
@@ -2,6 +2,14 @@ import logging
 import logging.handlers
 from pathlib import Path
 
+_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+_LOG_FORMATTER = logging.Formatter(_LOG_FORMAT)
+
+# Resolve loggers once; logging.getLogger takes the module-level logging lock on each call
+_ROOT_LOGGER = logging.getLogger()
+_OPI_LOGGER = logging.getLogger("opi")
+_JINJA_ROOS_LOGGER = logging.getLogger("jinja_roos_components.extension")
+
 
 def setup_logging(log_to_file: bool = False, log_file_path: str = "log.txt") -> None:
     """
@@ -11,27 +19,23 @@ def setup_logging(log_to_file: bool = False, log_file_path: str = "log.txt") ->
         log_to_file: Whether to enable file logging alongside stdout
         log_file_path: Path to log file when file logging is enabled
     """
-    # Create logger configuration
-    log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-
     # Clear any existing handlers
-    root_logger = logging.getLogger()
+    root_logger = _ROOT_LOGGER
     root_logger.handlers.clear()
 
     # Set global log level to INFO to reduce noise from external packages
     root_logger.setLevel(logging.INFO)
 
     # Set all OPI modules to DEBUG level for detailed application logging
-    opi_logger = logging.getLogger("opi")
-    opi_logger.setLevel(logging.DEBUG)
+    _OPI_LOGGER.setLevel(logging.DEBUG)
 
     # Configure specific module log levels for known noisy modules
-    logging.getLogger("jinja_roos_components.extension").setLevel(logging.INFO)
+    _JINJA_ROOS_LOGGER.setLevel(logging.INFO)
 
     # Always add stdout handler
     stdout_handler = logging.StreamHandler()
     stdout_handler.setLevel(logging.DEBUG)
-    stdout_handler.setFormatter(logging.Formatter(log_format))
+    stdout_handler.setFormatter(_LOG_FORMATTER)
     root_logger.addHandler(stdout_handler)
 
     # Add file handler if requested
@@ -48,7 +52,7 @@ def setup_logging(log_to_file: bool = False, log_file_path: str = "log.txt") ->
                 backupCount=5,
             )
             file_handler.setLevel(logging.DEBUG)
-            file_handler.setFormatter(logging.Formatter(log_format))
+            file_handler.setFormatter(_LOG_FORMATTER)
             root_logger.addHandler(file_handler)
 
             logging.info(f"File logging enabled: {log_file_path}")
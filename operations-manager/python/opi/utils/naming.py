@@ -5,9 +5,34 @@ This module provides standardized methods for generating unique names for Kubern
 including deployments, services, PVCs, and other manifest resources.
 """
 
-import re
+import itertools
+import logging
+import string
+from collections.abc import Iterable
+from functools import lru_cache
 
+logger = logging.getLogger(__name__)
 
+# Translation table deleting every ASCII character outside [a-z0-9] from storage names
+_STORAGE_DELETE_TABLE = str.maketrans(
+    "", "", "".join(chr(c) for c in range(128) if chr(c) not in string.ascii_lowercase + string.digits)
+)
+
+# Translation table that lowercases ASCII letters and maps hyphens to underscores
+_IDENTIFIER_TABLE = str.maketrans(string.ascii_uppercase + "-", string.ascii_lowercase + "_")
+
+# Separator normalization for generate_resource_identifier: the other separator is mapped to the chosen one
+_SEPARATOR_TABLES = {
+    "_": str.maketrans("-", "_"),
+    "-": str.maketrans("_", "-"),
+}
+
+# Characters allowed in Kubernetes (DNS-1123 label) names
+_K8S_ALNUM_CHARS = frozenset(string.ascii_lowercase + string.digits)
+_K8S_VALID_CHARS = _K8S_ALNUM_CHARS | {"-"}
+
+
+@lru_cache(maxsize=2048)
 def generate_unique_name(deployment_name: str, component_name: str) -> str:
     """
     Generate a unique name for Kubernetes resources using deployment and component names.
@@ -28,6 +53,7 @@ def generate_unique_name(deployment_name: str, component_name: str) -> str:
     return f"{deployment_name}-{component_name}"
 
 
+@lru_cache(maxsize=2048)
 def generate_storage_name(mount_path: str, index: int) -> str:
     """
     Generate a storage name based on mount path or index.
@@ -50,16 +76,16 @@ def generate_storage_name(mount_path: str, index: int) -> str:
     if not mount_path:
         return f"storage{index}"
 
-    # Remove leading slash and replace invalid characters
-    storage_name = mount_path.lstrip("/").replace("/", "").replace("-", "").replace("_", "")
-
-    # Ensure the name is valid (lowercase alphanumeric)
-    storage_name = re.sub(r"[^a-z0-9]", "", storage_name.lower())
+    # Keep only lowercase alphanumeric characters (slashes, hyphens, etc. are dropped)
+    storage_name = mount_path.lower().translate(_STORAGE_DELETE_TABLE)
+    if not storage_name.isascii():
+        storage_name = "".join(char for char in storage_name if char.isascii())
 
     # Use fallback if processing results in empty string
     return storage_name or f"storage{index}"
 
 
+@lru_cache(maxsize=2048)
 def generate_pvc_name(unique_name: str, storage_name: str) -> str:
     """
     Generate a PVC name using the unique resource name and storage name.
@@ -94,6 +120,7 @@ def generate_manifest_name(component_name: str, manifest_type: str) -> str:
     return f"{component_name}-{manifest_type}"
 
 
+@lru_cache(maxsize=2048)
 def sanitize_kubernetes_name(name: str, max_length: int = 63) -> str:
     """
     Sanitize a string to be a valid Kubernetes resource name.
@@ -114,12 +141,29 @@ def sanitize_kubernetes_name(name: str, max_length: int = 63) -> str:
     if not name:
         return "unnamed"
 
-    # Convert to lowercase and replace invalid characters with hyphens
-    sanitized = re.sub(r"[^a-z0-9-]", "-", name.lower())
+    # Fast path: name is already valid
+    if (
+        len(name) <= max_length
+        and name[0] != "-"
+        and name[-1] != "-"
+        and _K8S_VALID_CHARS.issuperset(name)
+        and "--" not in name
+    ):
+        return name
 
-    # Remove leading/trailing hyphens and consecutive hyphens
-    sanitized = re.sub(r"^-+|-+$", "", sanitized)
-    sanitized = re.sub(r"-+", "-", sanitized)
+    # Single pass: invalid characters become hyphens, runs of hyphens collapse into one,
+    # and leading/trailing hyphens are dropped (a hyphen is only emitted before an alnum char)
+    chars: list[str] = []
+    pending_hyphen = False
+    for char in name.lower():
+        if char in _K8S_ALNUM_CHARS:
+            if pending_hyphen and chars:
+                chars.append("-")
+            pending_hyphen = False
+            chars.append(char)
+        else:
+            pending_hyphen = True
+    sanitized = "".join(chars)
 
     # Truncate if too long
     if len(sanitized) > max_length:
@@ -129,6 +173,7 @@ def sanitize_kubernetes_name(name: str, max_length: int = 63) -> str:
     return sanitized or "unnamed"
 
 
+@lru_cache(maxsize=2048)
 def generate_hostname(component_name: str, deployment_name: str, project_name: str, ingress_postfix: str) -> str:
     """
     Generate a hostname for ingress based on component, deployment, project names and cluster configuration.
@@ -146,7 +191,7 @@ def generate_hostname(component_name: str, deployment_name: str, project_name: s
         generate_hostname("webapp", "frontend", "myproject", ".dev.example.com")
         -> "webapp-frontend-myproject.dev.example.com"
     """
-    return f"{component_name}-{deployment_name}-{project_name}{ingress_postfix}"
+    return "".join((component_name, "-", deployment_name, "-", project_name, ingress_postfix))
 
 
 def generate_ingress_map(
@@ -176,24 +221,17 @@ def generate_ingress_map(
             "frontend-webapp-subdomain": "api.dev.example.com"
         }
     """
-    # Generate the base unique name for the resource
-    base_name = generate_unique_name(deployment_name, component_name)
-
-    # Default ingress with standard naming
-    default_hostname = generate_hostname(component_name, deployment_name, project_name, ingress_postfix)
-
-    ingress_map = {base_name: default_hostname}
+    # Base unique name and default hostname (same formats as generate_unique_name / generate_hostname)
+    base_name = f"{deployment_name}-{component_name}"
+    default_hostname = f"{component_name}-{deployment_name}-{project_name}{ingress_postfix}"
 
     # Add subdomain ingress if subdomain is specified
     if subdomain:
-        # Extract domain from ingress_postfix (remove leading dot if present)
-        domain = ingress_postfix.lstrip(".")
-        subdomain_hostname = f"{subdomain}.{domain}"
-        subdomain_ingress_name = f"{base_name}-subdomain"
-
-        ingress_map[subdomain_ingress_name] = subdomain_hostname
+        # Extract domain from ingress_postfix (remove a single leading dot if present)
+        domain = ingress_postfix.removeprefix(".")
+        return {base_name: default_hostname, f"{base_name}-subdomain": f"{subdomain}.{domain}"}
 
-    return ingress_map
+    return {base_name: default_hostname}
 
 
 # Simple resource naming utilities
@@ -220,33 +258,62 @@ def generate_resource_identifier(project_name: str, postfix: str, separator: str
         generate_resource_identifier("myproject", "frontend", "_") -> "myproject_frontend"
         generate_resource_identifier("myproject", "frontend", "-") -> "myproject-frontend"
     """
-    # Clean the inputs - just lowercase
-    project_clean = project_name.lower()
-    postfix_clean = postfix.lower()
-
-    # Combine with separator
-    identifier = f"{project_clean}{separator}{postfix_clean}"
-
-    # Final character normalization based on separator choice
-    if separator == "_":
-        identifier = identifier.replace("-", "_")
-    elif separator == "-":
-        identifier = identifier.replace("_", "-")
+    identifier = _join_resource_identifier(project_name, postfix, separator)
 
-    # Truncate if needed
+    # Truncate if needed; not cached so every truncation is logged
     if len(identifier) > max_length:
         original_identifier = identifier
         identifier = identifier[:max_length]
-        import logging
-
-        logger = logging.getLogger(__name__)
         logger.warning(
-            f"Resource identifier truncated from '{original_identifier}' to '{identifier}' (max_length={max_length})"
+            "Resource identifier truncated from '%s' to '%s' (max_length=%d)",
+            original_identifier,
+            identifier,
+            max_length,
         )
 
     return identifier
 
 
+@lru_cache(maxsize=2048)
+def _join_resource_identifier(project_name: str, postfix: str, separator: str) -> str:
+    """
+    Combine the cleaned project name and postfix, without truncation.
+
+    Args:
+        project_name: Name of the project
+        postfix: The postfix to append
+        separator: Character to use between parts
+
+    Returns:
+        Untruncated resource identifier string
+    """
+    # Clean the inputs - lowercase and normalize separators based on separator choice
+    project_clean = _fast_lower(project_name)
+    postfix_clean = _fast_lower(postfix)
+    separator_table = _SEPARATOR_TABLES.get(separator)
+    if separator_table is not None:
+        project_clean = project_clean.translate(separator_table)
+        postfix_clean = postfix_clean.translate(separator_table)
+
+    return f"{project_clean}{separator}{postfix_clean}"
+
+
+def _fast_lower(value: str) -> str:
+    """
+    Lowercase a string, returning it unchanged when it is already lowercase ASCII.
+
+    Names coming from validated project configuration are almost always lowercase
+    already, so this avoids allocating a copy in the common case.
+
+    Args:
+        value: String to lowercase
+
+    Returns:
+        Lowercase string
+    """
+    return value if value.islower() and value.isascii() else value.lower()
+
+
 def _sanitize_for_identifier(value: str) -> str:
     """
     Sanitize a string for use in database/system identifiers.
@@ -259,14 +326,18 @@ def _sanitize_for_identifier(value: str) -> str:
     Returns:
         Sanitized string safe for use as identifier
     """
-    return value.replace("-", "_").lower()
+    sanitized = value.translate(_IDENTIFIER_TABLE)
+    # The table only covers ASCII; lowercase any remaining non-ASCII characters
+    return sanitized if sanitized.isascii() else sanitized.lower()
 
 
+@lru_cache(maxsize=4096)
 def _sanitize_for_lowercase(value: str) -> str:
     """
     Sanitize a string for use in lowercase-only contexts.
 
-    Keeps hyphens but ensures lowercase.
+    Keeps hyphens but ensures lowercase. Results are cached because the same
+    cluster, project and deployment names are lowercased by every path generator.
 
     Args:
         value: String to sanitize
@@ -274,23 +345,27 @@ def _sanitize_for_lowercase(value: str) -> str:
     Returns:
         Lowercase string with original separators
     """
-    return value.lower()
+    return _fast_lower(value)
 
 
-def _truncate_if_needed(name: str, max_length: int) -> str:
+@lru_cache(maxsize=1024)
+def _identifier_pair(project_name: str, deployment_name: str) -> str:
     """
-    Truncate name if it exceeds maximum length.
+    Build the shared {project}_{deployment} identifier.
+
+    Database usernames, schemas, database names and MinIO usernames all use this
+    format, so it is computed once per project/deployment pair.
 
     Args:
-        name: Name to potentially truncate
-        max_length: Maximum allowed length
+        project_name: Name of the project
+        deployment_name: Name of the deployment
 
     Returns:
-        Truncated name if needed
+        Identifier string, truncated to 63 characters
     """
-    if len(name) <= max_length:
-        return name
-    return name[:max_length]
+    project_clean = _sanitize_for_identifier(project_name)
+    deployment_clean = _sanitize_for_identifier(deployment_name)
+    return f"{project_clean}_{deployment_clean}"[:63]
 
 
 def generate_database_username(project_name: str, deployment_name: str) -> str:
@@ -306,10 +381,7 @@ def generate_database_username(project_name: str, deployment_name: str) -> str:
     Returns:
         Database username string
     """
-    project_clean = _sanitize_for_identifier(project_name)
-    deployment_clean = _sanitize_for_identifier(deployment_name)
-    username = f"{project_clean}_{deployment_clean}"
-    return _truncate_if_needed(username, 63)  # PostgreSQL username limit
+    return _identifier_pair(project_name, deployment_name)  # Truncated to the PostgreSQL username limit (63)
 
 
 def generate_database_schema(project_name: str, deployment_name: str) -> str:
@@ -325,10 +397,7 @@ def generate_database_schema(project_name: str, deployment_name: str) -> str:
     Returns:
         Database schema name string
     """
-    project_clean = _sanitize_for_identifier(project_name)
-    deployment_clean = _sanitize_for_identifier(deployment_name)
-    schema = f"{project_clean}_{deployment_clean}"
-    return _truncate_if_needed(schema, 63)  # PostgreSQL schema limit
+    return _identifier_pair(project_name, deployment_name)  # Truncated to the PostgreSQL schema limit (63)
 
 
 def generate_database_name(project_name: str, deployment_name: str) -> str:
@@ -344,10 +413,7 @@ def generate_database_name(project_name: str, deployment_name: str) -> str:
     Returns:
         Database name string
     """
-    project_clean = _sanitize_for_identifier(project_name)
-    deployment_clean = _sanitize_for_identifier(deployment_name)
-    database = f"{project_clean}_{deployment_clean}"
-    return _truncate_if_needed(database, 63)  # PostgreSQL database limit
+    return _identifier_pair(project_name, deployment_name)  # Truncated to the PostgreSQL database limit (63)
 
 
 def generate_minio_username(project_name: str, deployment_name: str) -> str:
@@ -363,10 +429,7 @@ def generate_minio_username(project_name: str, deployment_name: str) -> str:
     Returns:
         MinIO username string
     """
-    project_clean = _sanitize_for_identifier(project_name)
-    deployment_clean = _sanitize_for_identifier(deployment_name)
-    username = f"{project_clean}_{deployment_clean}"
-    return _truncate_if_needed(username, 63)  # MinIO username limit
+    return _identifier_pair(project_name, deployment_name)  # Truncated to the MinIO username limit (63)
 
 
 def generate_bucket_name(project_name: str, deployment_name: str) -> str:
@@ -382,12 +445,10 @@ def generate_bucket_name(project_name: str, deployment_name: str) -> str:
     Returns:
         Bucket name string (lowercase with hyphens)
     """
-    project_clean = _sanitize_for_lowercase(project_name)
-    deployment_clean = _sanitize_for_lowercase(deployment_name)
-    bucket = f"{project_clean}-{deployment_clean}"
-    return _truncate_if_needed(bucket, 63)  # S3 bucket name limit
+    return generate_project_deployment_prefix(project_name, deployment_name)[:63]  # S3 bucket name limit
 
 
+@lru_cache(maxsize=512)
 def generate_keycloak_client_id(project_name: str, deployment_name: str, component_name: str = None) -> str:
     """
     Generate a consistent Keycloak client ID.
@@ -402,16 +463,12 @@ def generate_keycloak_client_id(project_name: str, deployment_name: str, compone
     Returns:
         Keycloak client ID string
     """
-    project_clean = _sanitize_for_lowercase(project_name)
-    deployment_clean = _sanitize_for_lowercase(deployment_name)
+    client_id = generate_project_deployment_prefix(project_name, deployment_name)
 
     if component_name:
-        component_clean = _sanitize_for_lowercase(component_name)
-        client_id = f"{project_clean}-{deployment_clean}-{component_clean}"
-    else:
-        client_id = f"{project_clean}-{deployment_clean}"
+        client_id = f"{client_id}-{_sanitize_for_lowercase(component_name)}"
 
-    return _truncate_if_needed(client_id, 255)  # Keycloak client ID limit
+    return client_id[:255]  # Keycloak client ID limit
 
 
 def generate_argocd_application_name(project_name: str, deployment_name: str) -> str:
@@ -428,10 +485,7 @@ def generate_argocd_application_name(project_name: str, deployment_name: str) ->
     Returns:
         ArgoCD application name string
     """
-    project_clean = _sanitize_for_lowercase(project_name)
-    deployment_clean = _sanitize_for_lowercase(deployment_name)
-    app_name = f"{project_clean}-{deployment_clean}"
-    return _truncate_if_needed(app_name, 253)  # ArgoCD application name limit
+    return generate_project_deployment_prefix(project_name, deployment_name)[:253]  # ArgoCD application name limit
 
 
 def generate_argocd_application_filename(project_name: str, deployment_name: str) -> str:
@@ -448,10 +502,7 @@ def generate_argocd_application_filename(project_name: str, deployment_name: str
     Returns:
         ArgoCD application filename
     """
-    project_clean = _sanitize_for_lowercase(project_name)
-    deployment_clean = _sanitize_for_lowercase(deployment_name)
-    filename = f"{project_clean}-{deployment_clean}-argocd-application.yaml"
-    return filename
+    return f"{generate_project_deployment_prefix(project_name, deployment_name)}-argocd-application.yaml"
 
 
 def generate_gitops_manifests_folder_path(cluster: str, project_name: str, deployment_name: str) -> str:
@@ -522,6 +573,7 @@ def generate_deployment_manifest_path(
         return f"{cluster_clean}/{project_clean}/{deployment_clean}"
 
 
+@lru_cache(maxsize=1024)
 def generate_project_deployment_prefix(project_name: str, deployment_name: str) -> str:
     """
     Generate a consistent project-deployment prefix for naming.
@@ -536,6 +588,7 @@ def generate_project_deployment_prefix(project_name: str, deployment_name: str)
     Returns:
         Project-deployment prefix string
     """
+    # Cached: the ArgoCD application name/filename, bucket name and Keycloak client ID are all derived from it
     project_clean = _sanitize_for_lowercase(project_name)
     deployment_clean = _sanitize_for_lowercase(deployment_name)
     return f"{project_clean}-{deployment_clean}"
@@ -561,6 +614,7 @@ def generate_argocd_appproject_prefix(project_name: str, namespace: str) -> str:
     return f"{project_clean}-{namespace_clean}"
 
 
+@lru_cache(maxsize=256)
 def get_output_filename_from_template(template_filename: str, prefix: str = "") -> str:
     """
     Convert a Jinja2 template filename to the corresponding output filename.
@@ -573,7 +627,7 @@ def get_output_filename_from_template(template_filename: str, prefix: str = "")
         Output filename (e.g., "my-app-argocd-application.yaml")
     """
     # Remove .jinja extension if present
-    base_filename = template_filename[:-6] if template_filename.endswith(".jinja") else template_filename
+    base_filename = template_filename.removesuffix(".jinja")
     # Add prefix if provided
     return f"{prefix}-{base_filename}" if prefix else base_filename
 
@@ -621,9 +675,10 @@ def generate_project_admin_username(project_name: str, cluster: str) -> str:
     project_clean = _sanitize_for_identifier(project_name)
     cluster_clean = _sanitize_for_identifier(cluster)
     username = f"{project_clean}_{cluster_clean}_admin"
-    return _truncate_if_needed(username, 63)
+    return username[:63]
 
 
+@lru_cache(maxsize=512)
 def generate_project_realm_name(project_name: str, cluster: str) -> str:
     """
     Generate a consistent project realm name.
@@ -645,9 +700,10 @@ def generate_project_realm_name(project_name: str, cluster: str) -> str:
     project_clean = _sanitize_for_lowercase(project_name)
     cluster_clean = _sanitize_for_lowercase(cluster)
     realm = f"{project_clean}-{cluster_clean}"
-    return _truncate_if_needed(realm, 255)
+    return realm[:255]
 
 
+@lru_cache(maxsize=512)
 def generate_project_platform_client_id(project_name: str, cluster: str) -> str:
     """
     Generate a consistent client ID for the project's platform client.
@@ -669,4 +725,34 @@ def generate_project_platform_client_id(project_name: str, cluster: str) -> str:
     project_clean = _sanitize_for_lowercase(project_name)
     cluster_clean = _sanitize_for_lowercase(cluster)
     client_id = f"{project_clean}-{cluster_clean}-platform"
-    return _truncate_if_needed(client_id, 255)
+    return client_id[:255]
+
+
+def prewarm_naming_cache(projects: Iterable[str], deployments: Iterable[str], clusters: Iterable[str]) -> None:
+    """
+    Prime the naming caches for known project, deployment and cluster names.
+
+    Intended to be called at startup with the names loaded from project files, so the
+    first reconciliation pass hits the caches instead of building every name.
+
+    Args:
+        projects: Project names
+        deployments: Deployment names
+        clusters: Cluster names
+    """
+    projects = tuple(projects)
+    deployments = tuple(deployments)
+    clusters = tuple(clusters)
+
+    for value in itertools.chain(projects, deployments, clusters):
+        _sanitize_for_lowercase(value)
+
+    for project_name, deployment_name in itertools.product(projects, deployments):
+        _identifier_pair(project_name, deployment_name)
+        generate_bucket_name(project_name, deployment_name)
+        generate_keycloak_client_id(project_name, deployment_name)
+        generate_argocd_application_name(project_name, deployment_name)
+
+    for project_name, cluster in itertools.product(projects, clusters):
+        generate_project_realm_name(project_name, cluster)
+        generate_project_platform_client_id(project_name, cluster)
@@ -5,8 +5,56 @@ This module provides utilities for generating cryptographically secure passwords
 with configurable character set requirements.
 """
 
+import os
 import secrets
 import string
+from collections.abc import Iterator
+
+# Character sets used for password generation
+_UPPERCASE = string.ascii_uppercase
+_LOWERCASE = string.ascii_lowercase
+_DIGITS = string.digits
+_DEFAULT_CHARSET = string.ascii_letters + string.digits
+
+# Shared cryptographically secure RNG used to shuffle password characters
+_SYSTEM_RANDOM = secrets.SystemRandom()
+
+
+def _random_byte_stream(chunk_size: int) -> Iterator[int]:
+    """
+    Yield cryptographically secure random bytes, reading from os.urandom in chunks.
+
+    Args:
+        chunk_size: Number of bytes to read per os.urandom call
+
+    Yields:
+        Random byte values (0-255)
+    """
+    while True:
+        yield from os.urandom(chunk_size)
+
+
+def _unbiased_choice(charset: str, byte_stream: Iterator[int]) -> str:
+    """
+    Pick a character from charset using bytes from byte_stream.
+
+    Uses rejection sampling so every character is equally likely (no modulo bias).
+
+    Args:
+        charset: Characters to choose from
+        byte_stream: Source of random bytes (from _random_byte_stream)
+
+    Returns:
+        A randomly chosen character
+    """
+    size = len(charset)
+    if size > 256:
+        return secrets.choice(charset)
+    limit = 256 - 256 % size
+    for value in byte_stream:
+        if value < limit:
+            return charset[value % size]
+    raise RuntimeError("Random byte stream exhausted")
 
 
 def generate_secure_password(
@@ -44,27 +92,30 @@ def generate_secure_password(
 
     password_chars = []
 
+    # Read random bytes in one go (rejections are rare, so one read is usually enough)
+    byte_stream = _random_byte_stream(total_length * 2)
+
     # Add minimum required uppercase letters
-    password_chars.extend(secrets.choice(string.ascii_uppercase) for _ in range(min_uppercase))
+    password_chars.extend(_unbiased_choice(_UPPERCASE, byte_stream) for _ in range(min_uppercase))
 
     # Add minimum required lowercase letters
-    password_chars.extend(secrets.choice(string.ascii_lowercase) for _ in range(min_lowercase))
+    password_chars.extend(_unbiased_choice(_LOWERCASE, byte_stream) for _ in range(min_lowercase))
 
     # Add minimum required digits
-    password_chars.extend(secrets.choice(string.digits) for _ in range(min_digits))
+    password_chars.extend(_unbiased_choice(_DIGITS, byte_stream) for _ in range(min_digits))
 
     # Calculate remaining characters needed
     remaining_chars = total_length - len(password_chars)
 
     # Define the character set for remaining positions
     # Use alphanumeric characters plus any additional characters specified
-    char_set = string.ascii_letters + string.digits + additional_chars
+    char_set = _DEFAULT_CHARSET + additional_chars if additional_chars else _DEFAULT_CHARSET
 
     # Fill remaining positions with random characters from the full set
-    password_chars.extend(secrets.choice(char_set) for _ in range(remaining_chars))
+    password_chars.extend(_unbiased_choice(char_set, byte_stream) for _ in range(remaining_chars))
 
     # Shuffle all characters to avoid predictable patterns
-    secrets.SystemRandom().shuffle(password_chars)
+    _SYSTEM_RANDOM.shuffle(password_chars)
 
     return "".join(password_chars)
 
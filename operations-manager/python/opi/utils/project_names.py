@@ -8,6 +8,15 @@ import string
 
 from opi.core.config import settings
 
+# Characters stripped from display names before deriving the technical name
+_DISPLAY_NAME_INVALID_RE = re.compile(r"[^a-zA-Z0-9\s]")
+# Display names made up solely of these characters need no cleaning
+_DISPLAY_NAME_CLEAN_CHARS = frozenset(string.ascii_letters + string.digits + string.whitespace)
+# Valid technical project name: lowercase letter followed by lowercase letters, digits or dashes
+_PROJECT_NAME_CHARS = frozenset(string.ascii_lowercase + string.digits + "-")
+# Alphabet for the random 3-character postfix
+_POSTFIX_ALPHABET = string.ascii_lowercase + string.digits
+
 
 def generate_project_name(display_name: str) -> tuple[str, str]:
     """
@@ -31,16 +40,33 @@ def generate_project_name(display_name: str) -> tuple[str, str]:
         "WebShop" -> "webs_a9z", "WebShop"
         "API Gateway Service" -> "ags_m2n", "API Gateway Service"
     """
+    base = _compute_base(display_name)
+    return _assemble(base, _draw_postfix()), display_name.strip()
+
+
+def _compute_base(display_name: str) -> str:
+    """
+    Derive the base part of the technical name from a display name.
+
+    Args:
+        display_name: User-friendly project name
+
+    Returns:
+        Lowercase base derived from the words of the display name
+    """
     if not display_name or not display_name.strip():
         raise ValueError("Display name cannot be empty")
 
     display_name = display_name.strip()
 
     # Clean the display name: remove special characters, keep letters/numbers/spaces
-    cleaned = re.sub(r"[^a-zA-Z0-9\s]", "", display_name)
+    if _DISPLAY_NAME_CLEAN_CHARS.issuperset(display_name):
+        cleaned = display_name
+    else:
+        cleaned = _DISPLAY_NAME_INVALID_RE.sub("", display_name)
 
-    # Split into words
-    words = [word for word in cleaned.split() if word]
+    # Split into words (split() without arguments never yields empty strings)
+    words = cleaned.split()
 
     if not words:
         raise ValueError("Display name must contain at least one word with letters or numbers")
@@ -48,7 +74,7 @@ def generate_project_name(display_name: str) -> tuple[str, str]:
     # Generate the base name
     if len(words) > 1:
         # Multiple words: use first letter of each word
-        base = "".join(word[0].lower() for word in words if word)
+        base = "".join([word[0] for word in words]).lower()
         # Ensure we have at least 2 characters for the base
         if len(base) < 2:
             base = words[0][:4].lower()
@@ -57,13 +83,27 @@ def generate_project_name(display_name: str) -> tuple[str, str]:
         word = words[0]
         base = word[:5].lower() if len(word) >= 5 else word[:4].lower()
 
-    # Generate postfix: use fixed postfix if set, otherwise random 3 characters
+    return base
+
+
+def _draw_postfix() -> str:
+    """Return the fixed postfix if configured, otherwise 3 random characters (a-z, 0-9)."""
     if settings.FIXED_PROJECT_POSTFIX:
-        postfix = settings.FIXED_PROJECT_POSTFIX
-    else:
-        # Generate 3 random characters (letters and digits)
-        postfix = "".join(random.choice(string.ascii_lowercase + string.digits) for _ in range(3))
+        return settings.FIXED_PROJECT_POSTFIX
+    return "".join(random.choices(_POSTFIX_ALPHABET, k=3))
+
+
+def _assemble(base: str, postfix: str) -> str:
+    """
+    Combine a base and postfix into a technical name that starts with a letter and fits 20 characters.
+
+    Args:
+        base: Base derived from the display name
+        postfix: Postfix to append after the dash
 
+    Returns:
+        The technical project name
+    """
     # Combine: base + dash + postfix
     technical_name = f"{base}-{postfix}"
 
@@ -78,7 +118,7 @@ def generate_project_name(display_name: str) -> tuple[str, str]:
         available_chars = 20 - len(postfix) - 1  # -1 for dash, -len(postfix) for postfix
         technical_name = f"{base[:available_chars]}-{postfix}"
 
-    return technical_name, display_name
+    return technical_name
 
 
 def validate_generated_name(technical_name: str) -> bool:
@@ -95,11 +135,9 @@ def validate_generated_name(technical_name: str) -> bool:
         return False
     if len(technical_name) > 20:
         return False
-    if not technical_name[0].isalpha():
-        return False
-    if not re.match(r"^[a-z][a-z0-9-]*$", technical_name):
+    if not ("a" <= technical_name[0] <= "z"):
         return False
-    return True
+    return _PROJECT_NAME_CHARS.issuperset(technical_name)
 
 
 def ensure_unique_project_name(display_name: str, existing_names: set[str] | None = None) -> tuple[str, str]:
@@ -116,18 +154,22 @@ def ensure_unique_project_name(display_name: str, existing_names: set[str] | Non
     if existing_names is None:
         existing_names = set()
 
+    # Only the postfix varies between attempts, so derive the base once
+    base = _compute_base(display_name)
+    display = display_name.strip()
+
     max_attempts = 10
-    for attempt in range(max_attempts):
-        technical_name, display = generate_project_name(display_name)
+    for _attempt in range(max_attempts):
+        technical_name = _assemble(base, _draw_postfix())
 
         if technical_name not in existing_names and validate_generated_name(technical_name):
             return technical_name, display
 
     # If we couldn't generate a unique name, append attempt number
-    base_technical, display = generate_project_name(display_name)
+    prefix = _assemble(base, _draw_postfix())[:-1]
     for i in range(1, 100):
         # Replace last character with attempt number
-        technical_name = f"{base_technical[:-1]}{i % 10}"
+        technical_name = prefix + str(i % 10)
         if technical_name not in existing_names and validate_generated_name(technical_name):
             return technical_name, display
 
@@ -6,22 +6,91 @@ Extracted to avoid circular import issues.
 """
 
 import logging
-import re
+import string
+from functools import lru_cache
 from io import StringIO
 from typing import Any
 
 from fastapi import HTTPException
 from opi.core.config import settings
-from opi.services import ServiceAdapter
+from opi.services import ServiceAdapter, ServiceType
 from opi.utils.age import encrypt_age_content
 from opi.utils.api_keys import generate_api_key
-from opi.utils.sops import generate_sops_key_pair
+from opi.utils.sops import generate_sops_key_pair_async
 from ruamel.yaml import YAML
+from ruamel.yaml.nodes import ScalarNode
+from ruamel.yaml.representer import SafeRepresenter
 from ruamel.yaml.scalarstring import LiteralScalarString
 
 logger = logging.getLogger(__name__)
 
 
+class _ProjectYamlRepresenter(SafeRepresenter):
+    """
+    Safe representer that renders project YAML like the round-trip dumper does.
+
+    Used together with the libyaml C emitter: keeps mapping insertion order, emits
+    LiteralScalarString values as literal block scalars and double-quotes multiline strings.
+    """
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        super().__init__(*args, **kwargs)
+        self.sort_base_mapping_type_on_output = False
+
+    def represent_str(self, data: str) -> ScalarNode:
+        return self.represent_scalar("tag:yaml.org,2002:str", data, style='"' if "\n" in data else None)
+
+    def represent_literal_scalar_string(self, data: LiteralScalarString) -> ScalarNode:
+        # The C emitter only accepts exact str instances
+        return self.represent_scalar("tag:yaml.org,2002:str", str(data), style="|")
+
+
+_ProjectYamlRepresenter.add_representer(str, _ProjectYamlRepresenter.represent_str)
+_ProjectYamlRepresenter.add_representer(LiteralScalarString, _ProjectYamlRepresenter.represent_literal_scalar_string)
+
+
+# Shared dumper for project files backed by the libyaml C emitter. Dumping is synchronous and
+# the generator runs on the event loop, so one configured instance can be reused across calls.
+_PROJECT_YAML = YAML(typ="safe", pure=False)
+_PROJECT_YAML.Representer = _ProjectYamlRepresenter
+_PROJECT_YAML.default_flow_style = False
+_PROJECT_YAML.width = 4096  # Prevent line wrapping
+
+
+@lru_cache(maxsize=128)
+def _parse_services_cached(service_strings: tuple[str, ...]) -> tuple[tuple[ServiceType, ...], tuple[str, ...]]:
+    """
+    Parse service strings into ServiceType enums, memoized per distinct service list.
+
+    Components frequently request the same set of services, so each distinct
+    (ordered) list only has to be parsed once.
+
+    Args:
+        service_strings: The service strings as submitted in the form
+
+    Returns:
+        Tuple of (parsed ServiceType enums, their string values), both in submission order
+    """
+    services = tuple(ServiceAdapter.parse_services_from_strings(list(service_strings)))
+    return services, tuple(service.value for service in services)
+
+
+# Default AGE-encrypted password for the self-service git repository, shared by every generated project
+_DEFAULT_REPOSITORY_PASSWORD = LiteralScalarString("""-----BEGIN AGE ENCRYPTED FILE-----
+YWdlLWVuY3J5cHRpb24ub3JnL3YxCi0+IFgyNTUxOSA0K28zZERxZ29ZMjVuQVNP
+WEpMU0wwMXNPN2F1T3ZSK2M5TmN4b3RNY3dnCmhLN3FxLzcvN01OdmIxWXVFL00z
+dCt0L0drcVFZUTBKOERIZ3NQK3VFUGcKLS0tIFNCQUM3Z1U0MGJ3eTYxeC9Tb29Z
+ZmxTWm9BRGtpUExUVlN3N1JPUjRhV0kKt96lbcSOqLThEgvr67Pk3i4IBV6j8mPo
+ATTaHv3CMKcMQOrDcJ4Z2ilL6CgB/RUw+5G3mBZ/A0f1n5HdqYfXfLi8slY7348S
+DQ==
+-----END AGE ENCRYPTED FILE-----
+""")
+
+
+# Valid project name: lowercase letter followed by lowercase letters, digits or dashes
+_PROJECT_NAME_CHARS = frozenset(string.ascii_lowercase + string.digits + "-")
+
+
 def validate_project_name(name: str) -> bool:
     """
     Validate project name: must start with lowercase letter, then lowercase a-z, numbers 0-9, dash -, max 20 characters.
@@ -37,7 +106,7 @@ def validate_project_name(name: str) -> bool:
     if len(name) > 20:
         return False
     # Must start with a lowercase letter, then can contain lowercase letters, numbers, and dashes
-    return re.match(r"^[a-z][a-z0-9-]*$", name) is not None
+    return "a" <= name[0] <= "z" and _PROJECT_NAME_CHARS.issuperset(name)
 
 
 # should_encrypt_user_env_var function removed - all user env vars are now always encrypted
@@ -61,7 +130,7 @@ async def generate_self_service_project_yaml(project_data: Any) -> str:
     """
     # Generate AGE key pair for this project
     try:
-        private_key, public_key = generate_sops_key_pair()
+        private_key, public_key = await generate_sops_key_pair_async()
         # Encrypt the private key with the global SOPS AGE key for storage
         encrypted_private_key = await encrypt_age_content(private_key, settings.SOPS_AGE_PUBLIC_KEY)
         logger.debug(f"Generated AGE key pair for project: {project_data.project_name}")
@@ -78,32 +147,26 @@ async def generate_self_service_project_yaml(project_data: Any) -> str:
         logger.error(f"Failed to generate encrypted API key: {e}")
         raise HTTPException(status_code=500, detail=f"Cannot create project: API key encryption failed. {e!s}")
 
-    # Default encrypted password for git repository
-    age_password = """-----BEGIN AGE ENCRYPTED FILE-----
-YWdlLWVuY3J5cHRpb24ub3JnL3YxCi0+IFgyNTUxOSA0K28zZERxZ29ZMjVuQVNP
-WEpMU0wwMXNPN2F1T3ZSK2M5TmN4b3RNY3dnCmhLN3FxLzcvN01OdmIxWXVFL00z
-dCt0L0drcVFZUTBKOERIZ3NQK3VFUGcKLS0tIFNCQUM3Z1U0MGJ3eTYxeC9Tb29Z
-ZmxTWm9BRGtpUExUVlN3N1JPUjRhV0kKt96lbcSOqLThEgvr67Pk3i4IBV6j8mPo
-ATTaHv3CMKcMQOrDcJ4Z2ilL6CgB/RUw+5G3mBZ/A0f1n5HdqYfXfLi8slY7348S
-DQ==
------END AGE ENCRYPTED FILE-----
-"""
-
     # Parse project-level services using the service adapter
-    project_services = ServiceAdapter.parse_services_from_strings(project_data.services or [])
+    project_services, project_service_values = _parse_services_cached(tuple(project_data.services or ()))
 
-    # Build components list from form data
+    # Build components and deployments lists from form data
     components_list = []
+    deployments_list = []
     if project_data.components:
+        # Bind the appends once; the loop can run for many components
+        append_component = components_list.append
+        append_deployment = deployments_list.append
         for idx, comp in enumerate(project_data.components):
             # Parse component-level services
-            component_services = ServiceAdapter.parse_services_from_strings(comp.services or [])
+            component_services, component_service_values = _parse_services_cached(tuple(comp.services or ()))
+            component_name = f"component-{idx + 1}"
 
             component_config = {
-                "name": f"component-{idx + 1}",
+                "name": component_name,
                 "type": comp.type,
                 "ports": {"inbound": [comp.port] if comp.port else [8080], "outbound": [80, 443]},
-                "uses-services": [service.value for service in component_services],
+                "uses-services": list(component_service_values),
                 "uses-components": [],
             }
 
@@ -127,7 +190,16 @@ DQ==
             except ValueError as e:
                 raise HTTPException(status_code=400, detail=str(e))
 
-            components_list.append(component_config)
+            append_component(component_config)
+            append_deployment(
+                {
+                    "name": f"deployment-{idx + 1}",
+                    "cluster": project_data.cluster,
+                    "namespace": project_data.project_name,
+                    "repository": "main-repo",
+                    "components": [{"reference": component_name, "image": comp.image or "nginx:latest"}],
+                }
+            )
     else:
         # Default component if none specified
         # Create fallback component with project-level services
@@ -135,7 +207,7 @@ DQ==
             "name": "main",
             "type": "deployment",
             "ports": {"inbound": [8080], "outbound": [80, 443]},
-            "uses-services": [service.value for service in project_services],
+            "uses-services": list(project_service_values),
             "uses-components": [],
         }
 
@@ -146,20 +218,6 @@ DQ==
 
         components_list.append(fallback_component_config)
 
-    # Build deployments list
-    deployments_list = []
-    if project_data.components:
-        for idx, comp in enumerate(project_data.components):
-            deployments_list.append(
-                {
-                    "name": f"deployment-{idx + 1}",
-                    "cluster": project_data.cluster,
-                    "namespace": project_data.project_name,
-                    "repository": "main-repo",
-                    "components": [{"reference": f"component-{idx + 1}", "image": comp.image or "nginx:latest"}],
-                }
-            )
-    else:
         # Default deployment
         deployments_list.append(
             {
@@ -177,7 +235,7 @@ DQ==
         "display-name": project_data.display_name,
         "description": project_data.project_description or "Project created via self-service portal",
         "clusters": [project_data.cluster],
-        "services": [service.value for service in project_services],  # Project-level services
+        "services": list(project_service_values),  # Project-level services
         "config": {
             "age-public-key": public_key,
             "age-private-key": LiteralScalarString(encrypted_private_key),
@@ -188,7 +246,7 @@ DQ==
                 "name": "main-repo",
                 "url": "https://github.com/RijksICTGilde/rig-cluster-application-test.git",
                 "username": "git",
-                "password": age_password,
+                "password": _DEFAULT_REPOSITORY_PASSWORD,
                 "branch": "main",
                 "path": ".",
             }
@@ -199,31 +257,18 @@ DQ==
 
     # Add users if provided
     if project_data.user_email and project_data.user_role:
-        users = []
-        for email, role in zip(project_data.user_email, project_data.user_role, strict=False):
-            if email and email.strip():  # Skip empty entries
-                users.append({"email": email.strip(), "role": role})
+        # Skip empty entries, keeping the stripped email
+        users = [
+            {"email": stripped_email, "role": role}
+            for email, role in zip(project_data.user_email, project_data.user_role, strict=False)
+            if email and (stripped_email := email.strip())
+        ]
         if users:
             project_config["users"] = users
 
-    # Use ruamel.yaml for proper multiline string handling
-    yaml_instance = YAML()
-    yaml_instance.preserve_quotes = True
-    yaml_instance.width = 4096  # Prevent line wrapping
-
-    # Handle multiline password with literal block scalar
-    password = project_config["repositories"][0]["password"]
-    if password and "\n" in password:
-        project_config["repositories"][0]["password"] = LiteralScalarString(password)
-
-    # Handle multiline API key with literal block scalar
-    api_key = project_config["config"]["api-key"]
-    if api_key and "\n" in api_key:
-        project_config["config"]["api-key"] = LiteralScalarString(api_key)
-
-    # Generate YAML content
+    # Generate YAML content with the C-accelerated emitter; literal block scalars keep multiline strings readable
     yaml_output = StringIO()
-    yaml_instance.dump(project_config, yaml_output)
+    _PROJECT_YAML.dump(project_config, yaml_output)
     yaml_content = yaml_output.getvalue()
 
     logger.info(
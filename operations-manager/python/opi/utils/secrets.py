@@ -5,6 +5,7 @@ This module provides a type-safe, declarative way to define and manage
 Kubernetes secrets with consistent key mappings and validation.
 """
 
+import inspect
 import logging
 from abc import ABC
 from dataclasses import dataclass
@@ -32,33 +33,49 @@ class SecretContext:
 class BaseSecret(ABC):
     """Base class for all secret types with generic create/get methods."""
 
+    __slots__ = ()
+
     # Each subclass defines these
     SECRET_NAME_TEMPLATE: ClassVar[str] = ""
     SERVICE_TYPE: ClassVar[ServiceType]
 
+    # (attribute, (main key, *aliases)) for every secret-sourced variable, resolved once per subclass
+    _OUTPUT_PLAN: ClassVar[tuple[tuple[str, tuple[str, ...]], ...]] = ()
+    # Every output key of the plan in order, copied as the presized starting dict for to_k8s_secret_data
+    _OUTPUT_TEMPLATE: ClassVar[dict[str, str]] = {}
+    # Subset of the output plan that maps onto constructor fields, probed in key order
+    _FROM_K8S_KEYS: ClassVar[tuple[tuple[str, tuple[str, ...]], ...]] = ()
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        service_type = getattr(cls, "SERVICE_TYPE", None)
+        if service_type is not None:
+            cls._OUTPUT_PLAN = tuple(
+                (var_def.secret_key, (var_def.name, *var_def.aliases))
+                for var_def in ServiceAdapter.get_service_definition(service_type).variables
+                if var_def.source == "secret" and var_def.secret_key
+            )
+            cls._OUTPUT_TEMPLATE = dict.fromkeys(
+                (k8s_key for _, k8s_keys in cls._OUTPUT_PLAN for k8s_key in k8s_keys), ""
+            )
+            # Computed values such as DatabaseSecret.connection_string are not constructor fields
+            fields = {name for klass in cls.__mro__ for name in inspect.get_annotations(klass)}
+            cls._FROM_K8S_KEYS = tuple(entry for entry in cls._OUTPUT_PLAN if entry[0] in fields)
+
     def __post_init__(self) -> None:
         """Default post-initialization hook. Subclasses can override for custom validation."""
 
-    def _get_service_variables(self) -> list[Any]:
-        return ServiceAdapter.get_service_definition(self.SERVICE_TYPE).variables
-
     def to_k8s_secret_data(self) -> dict[str, str]:
         """Convert dataclass fields to Kubernetes secret key-value pairs including aliases."""
-        secret_data: dict[str, str] = {}
+        # Start from the class template so the dict is sized once; every key is overwritten below
+        secret_data = self._OUTPUT_TEMPLATE.copy()
 
-        # Get all variables from service definition
-        variables = self._get_service_variables()
+        for attr, k8s_keys in self._OUTPUT_PLAN:
+            value_str = str(getattr(self, attr))
 
-        for var_def in variables:
-            if var_def.source == "secret" and var_def.secret_key:
-                value_str = str(getattr(self, var_def.secret_key))
-
-                # Add main key
-                secret_data[var_def.name] = value_str
-
-                # Add all aliases
-                for alias in var_def.aliases:
-                    secret_data[alias] = value_str
+            # Add main key and all aliases
+            for k8s_key in k8s_keys:
+                secret_data[k8s_key] = value_str
 
         # Allow subclasses to add computed/additional keys
         additional_keys = self._get_additional_keys()
@@ -75,25 +92,13 @@ class BaseSecret(ABC):
         """Create instance from Kubernetes secret data using service definitions."""
         kwargs = {}
 
-        if cls.SERVICE_TYPE is None:
-            # This method should only be called on concrete subclasses, not the abstract base class
-            return cls(**kwargs)
-
-        service_def = ServiceAdapter.get_service_definition(cls.SERVICE_TYPE)
-        variables = service_def.get("variables", [])
-
-        for var_def in variables:
-            if var_def.source == "secret":
-                # Try main key first, then aliases
-                k8s_keys_to_try = [var_def.name] + var_def.aliases
-
-                for k8s_key in k8s_keys_to_try:
-                    if k8s_key in secret_data:
-                        value = secret_data[k8s_key]
-                        # Handle type conversion if needed
-                        value = cls._convert_field_value(var_def.secret_key, value)
-                        kwargs[var_def.secret_key] = value
-                        break
+        for secret_key, k8s_keys in cls._FROM_K8S_KEYS:
+            # Try main key first, then aliases
+            for k8s_key in k8s_keys:
+                if k8s_key in secret_data:
+                    # Handle type conversion if needed
+                    kwargs[secret_key] = cls._convert_field_value(secret_key, secret_data[k8s_key])
+                    break
 
         # This method should only be called on concrete subclasses, not the abstract base class
         return cls(**kwargs)
@@ -141,23 +146,21 @@ class BaseSecret(ABC):
         Convert to configuration data using only main keys (no aliases).
         Used for encrypted project configuration storage.
         """
-        if self.SERVICE_TYPE is None:
+        if getattr(self, "SERVICE_TYPE", None) is None:
             # For UserSecret and other custom secrets, fall back to current behavior
             return self.to_k8s_secret_data()
 
         config_data: dict[str, str] = {}
-        variables = self._get_service_variables()
 
         # Only include main variable names (not aliases)
-        for var_def in variables:
-            if var_def.source == "secret" and hasattr(self, var_def.secret_key):
-                value = getattr(self, var_def.secret_key)
-                config_data[var_def.name] = str(value)
+        for attr, k8s_keys in self._OUTPUT_PLAN:
+            if hasattr(self, attr):
+                config_data[k8s_keys[0]] = str(getattr(self, attr))
 
         return config_data
 
 
-@dataclass
+@dataclass(slots=True)
 class DatabaseSecret(BaseSecret):
     """Database secret configuration using service definitions."""
 
@@ -173,7 +176,8 @@ class DatabaseSecret(BaseSecret):
 
     def __post_init__(self) -> None:
         """Validate database secret data."""
-        super().__post_init__()  # Call parent's default implementation
+        # Explicit base call: zero-argument super() does not work in slots=True dataclasses
+        BaseSecret.__post_init__(self)
 
     @property
     def connection_string(self) -> str:
@@ -196,7 +200,7 @@ class DatabaseSecret(BaseSecret):
         return value
 
 
-@dataclass
+@dataclass(slots=True)
 class MinIOSecret(BaseSecret):
     """MinIO/Object Store secret configuration using service definitions."""
 
@@ -211,10 +215,10 @@ class MinIOSecret(BaseSecret):
 
     def __post_init__(self) -> None:
         """Validate MinIO secret data."""
-        super().__post_init__()  # Call parent's default implementation
+        BaseSecret.__post_init__(self)  # Call parent's default implementation
 
 
-@dataclass
+@dataclass(slots=True)
 class KeycloakSecret(BaseSecret):
     """Keycloak/OIDC secret configuration."""
 
@@ -227,10 +231,10 @@ class KeycloakSecret(BaseSecret):
 
     def __post_init__(self) -> None:
         """Validate Keycloak secret data."""
-        super().__post_init__()  # Call parent's default implementation
+        BaseSecret.__post_init__(self)  # Call parent's default implementation
 
 
-@dataclass
+@dataclass(slots=True)
 class UserSecret(BaseSecret):
     """User-defined environment variables secret."""
 
@@ -240,7 +244,7 @@ class UserSecret(BaseSecret):
 
     def __post_init__(self) -> None:
         """Validate user secret data."""
-        super().__post_init__()  # Call parent's default implementation
+        BaseSecret.__post_init__(self)  # Call parent's default implementation
 
     def to_k8s_secret_data(self) -> dict[str, str]:
         """For user secrets, the env_vars dict is the secret data."""
@@ -7,13 +7,16 @@ This module handles SOPS-specific operations including key generation and encryp
 For pure Age encryption, use the age.py module.
 """
 
-import glob
+import asyncio
 import logging
 import os
 import subprocess
 import tempfile
-import uuid
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, cast
 
+from cryptography.hazmat.primitives.asymmetric.x25519 import X25519PrivateKey
 from opi.core.config import settings
 from opi.utils.age import encrypt_age_content
 
@@ -38,6 +41,36 @@ def get_sops_private_key() -> str | None:
     return settings.SOPS_AGE_PRIVATE_KEY
 
 
+async def _run_command_async(
+    cmd: list[str], stdout: IO[bytes] | int = asyncio.subprocess.PIPE
+) -> subprocess.CompletedProcess[str]:
+    """
+    Run a command without blocking the event loop, capturing its output as text.
+
+    Args:
+        cmd: Command and arguments to run
+        stdout: Where the command writes its stdout; captured by default
+
+    Returns:
+        The completed process with decoded stdout (empty when redirected) and stderr
+    """
+    process = await asyncio.create_subprocess_exec(*cmd, stdout=stdout, stderr=asyncio.subprocess.PIPE)
+    out, err = await process.communicate()
+    return subprocess.CompletedProcess(
+        cmd, cast(int, process.returncode), out.decode("utf-8") if out is not None else "", err.decode("utf-8")
+    )
+
+
+def _decrypted_content(process: subprocess.CompletedProcess[str]) -> str | None:
+    if process.returncode != 0:
+        error_msg = process.stderr.strip()
+        logger.error(f"SOPS decryption failed: {error_msg}")
+        return None
+
+    logger.debug("Successfully decrypted SOPS file")
+    return process.stdout
+
+
 def decrypt_sops_file(file_path: str) -> str | None:
     """
     Decrypt a SOPS-encrypted file.
@@ -52,15 +85,52 @@ def decrypt_sops_file(file_path: str) -> str | None:
     logger.debug(f"Running SOPS decryption command: {' '.join(cmd)}")
 
     process = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=False)
+    return _decrypted_content(process)
+
+
+async def decrypt_sops_file_async(file_path: str) -> str | None:
+    """
+    Decrypt a SOPS-encrypted file without blocking the event loop.
+
+    Args:
+        file_path: Path to the SOPS-encrypted file
+
+    Returns:
+        Decrypted content as string, or None if decryption failed
+    """
+    cmd = ["sops", "--decrypt", file_path]
+    logger.debug(f"Running SOPS decryption command: {' '.join(cmd)}")
+
+    return _decrypted_content(await _run_command_async(cmd))
+
+
+async def decrypt_sops_files(file_paths: Iterable[str]) -> dict[str, str | None]:
+    """
+    Decrypt several SOPS-encrypted files concurrently, with at most one SOPS process per CPU at a time.
+
+    Args:
+        file_paths: Paths to the SOPS-encrypted files
+
+    Returns:
+        Mapping of each path to its decrypted content, or None if decryption of that file failed
+    """
+    semaphore = asyncio.Semaphore(os.cpu_count() or 1)
+
+    async def decrypt(file_path: str) -> tuple[str, str | None]:
+        async with semaphore:
+            return file_path, await decrypt_sops_file_async(file_path)
+
+    return dict(await asyncio.gather(*(decrypt(file_path) for file_path in file_paths)))
+
 
+def _encryption_succeeded(process: subprocess.CompletedProcess[str]) -> bool:
     if process.returncode != 0:
         error_msg = process.stderr.strip()
-        logger.error(f"SOPS decryption failed: {error_msg}")
-        return None
+        logger.error(f"SOPS encryption failed: {error_msg}")
+        return False
 
-    decrypted_content = process.stdout
-    logger.debug("Successfully decrypted SOPS file")
-    return decrypted_content
+    logger.debug("Successfully encrypted file with SOPS")
+    return True
 
 
 def encrypt_sops_file(file_path: str) -> bool:
@@ -77,13 +147,143 @@ def encrypt_sops_file(file_path: str) -> bool:
     logger.debug(f"Running SOPS encryption command: {' '.join(cmd)}")
 
     process = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=False)
+    return _encryption_succeeded(process)
 
-    if process.returncode != 0:
-        error_msg = process.stderr.strip()
-        logger.error(f"SOPS encryption failed: {error_msg}")
-        return False
 
-    logger.debug("Successfully encrypted file with SOPS")
+async def encrypt_sops_file_async(file_path: str) -> bool:
+    """
+    Encrypt a file using SOPS without blocking the event loop.
+
+    Args:
+        file_path: Path to the file to encrypt
+
+    Returns:
+        True if encryption was successful, False otherwise
+    """
+    cmd = ["sops", "--encrypt", "--in-place", file_path]
+    logger.debug(f"Running SOPS encryption command: {' '.join(cmd)}")
+
+    return _encryption_succeeded(await _run_command_async(cmd))
+
+
+def _sops_age_encrypt_cmd(file_path: str, public_key: str) -> list[str]:
+    cmd = ["sops", "--encrypt", "--age", public_key, file_path]
+    logger.debug(f"Running SOPS encryption command: {' '.join(cmd)}")
+    return cmd
+
+
+def _sops_output_path(file_path: str) -> str:
+    # Generate the output filename (.sops.yaml) next to the .to-sops.yaml file
+    return file_path.removesuffix(".to-sops.yaml") + ".sops.yaml"
+
+
+def _create_sops_temp_outputs(to_sops_files: list[str]) -> list[str]:
+    """
+    Create an empty temporary output file next to each .sops.yaml target.
+
+    SOPS streams into these, and only a successful result is moved onto the target, so an existing
+    .sops.yaml is never truncated by a failing run.
+
+    Args:
+        to_sops_files: The .to-sops.yaml files to encrypt
+
+    Returns:
+        The temporary output path for each file, in the same order
+    """
+    temp_paths: list[str] = []
+    try:
+        for file_path in to_sops_files:
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(file_path) or ".", suffix=".sops.yaml.tmp")
+            os.close(fd)
+            temp_paths.append(temp_path)
+    except BaseException:
+        _remove_sops_temp_outputs(temp_paths)
+        raise
+    return temp_paths
+
+
+def _remove_sops_temp_outputs(temp_paths: Iterable[str]) -> None:
+    # Temporary outputs that were moved onto their target are gone already
+    for temp_path in temp_paths:
+        try:
+            os.remove(temp_path)
+        except FileNotFoundError:
+            pass
+
+
+def _run_sops_encrypt(file_path: str, temp_path: str, public_key: str) -> subprocess.CompletedProcess[str]:
+    """
+    Run SOPS to encrypt a single file with an AGE public key, streaming the output to a temporary file.
+
+    Args:
+        file_path: Path to the file to encrypt
+        temp_path: Temporary file that receives the encrypted output
+        public_key: The AGE public key for encryption
+
+    Returns:
+        The completed SOPS process
+    """
+    cmd = _sops_age_encrypt_cmd(file_path, public_key)
+    with open(temp_path, "wb") as output:
+        return subprocess.run(cmd, stdout=output, stderr=subprocess.PIPE, text=True, check=False)
+
+
+def _find_to_sops_files(directory: str) -> list[str]:
+    # Find all .to-sops.yaml files in the directory; scandir hands back the file type with each
+    # entry, so this costs no stat per file. Hidden files are skipped like a "*" glob would
+    try:
+        with os.scandir(directory) as entries:
+            to_sops_files = [
+                entry.path
+                for entry in entries
+                if entry.name.endswith(".to-sops.yaml") and not entry.name.startswith(".") and entry.is_file()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
+        # Nothing to encrypt; scandir's failed open is the existence check, no separate isdir needed
+        logger.debug(f"Directory {directory} does not exist, no .to-sops.yaml files to encrypt")
+        return []
+
+    if to_sops_files:
+        logger.info(f"Found {len(to_sops_files)} .to-sops.yaml files to encrypt")
+    else:
+        logger.debug(f"No .to-sops.yaml files found in {directory}")
+    return to_sops_files
+
+
+def _finish_sops_results(
+    to_sops_files: list[str], temp_paths: list[str], processes: Iterable[subprocess.CompletedProcess[str]]
+) -> bool:
+    """
+    Move each encrypted output onto its .sops.yaml file and remove the original, in file order, until the first
+    failed SOPS process.
+
+    From the failed file onward the targets and originals are left as they were; the caller removes the
+    temporary outputs that were not moved.
+
+    Args:
+        to_sops_files: The encrypted .to-sops.yaml files, in processing order
+        temp_paths: The temporary output of each file, in the same order
+        processes: The SOPS process for each file, in the same order
+
+    Returns:
+        True if all files were encrypted successfully, False on the first failure
+    """
+    for file_path, temp_path, process in zip(to_sops_files, temp_paths, processes, strict=True):
+        output_path = _sops_output_path(file_path)
+
+        if process.returncode != 0:
+            error_msg = process.stderr.strip()
+            logger.error(f"SOPS encryption failed for {file_path}: {error_msg}")
+            return False
+
+        # mkstemp creates owner-only files; give the output the mode a plain open() would
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, output_path)
+
+        # Remove the original .to-sops.yaml file
+        os.remove(file_path)
+        logger.info(f"Successfully encrypted {file_path} -> {output_path}")
+
     return True
 
 
@@ -91,6 +291,9 @@ def encrypt_to_sops_files(directory: str, public_key: str) -> bool:
     """
     Encrypt all .to-sops.yaml files in a directory using SOPS, renaming them to .sops.yaml.
 
+    The SOPS processes run concurrently into temporary files; their output is moved into place and
+    the originals removed afterwards, in file order.
+
     Args:
         directory: Directory containing .to-sops.yaml files
         public_key: The AGE public key for encryption
@@ -100,43 +303,73 @@ def encrypt_to_sops_files(directory: str, public_key: str) -> bool:
     """
 
     try:
-        # Find all .to-sops.yaml files in the directory
-        pattern = os.path.join(directory, "*.to-sops.yaml")
-        to_sops_files = glob.glob(pattern)
-
+        to_sops_files = _find_to_sops_files(directory)
         if not to_sops_files:
-            logger.debug(f"No .to-sops.yaml files found in {directory}")
             return True
 
-        logger.info(f"Found {len(to_sops_files)} .to-sops.yaml files to encrypt")
+        temp_paths = _create_sops_temp_outputs(to_sops_files)
+        try:
+            # Each sops invocation is an independent process, so run them side by side
+            max_workers = min(len(to_sops_files), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                processes = list(
+                    executor.map(_run_sops_encrypt, to_sops_files, temp_paths, [public_key] * len(to_sops_files))
+                )
+            return _finish_sops_results(to_sops_files, temp_paths, processes)
+        finally:
+            _remove_sops_temp_outputs(temp_paths)
+
+    except FileNotFoundError:
+        logger.exception("sops command not found. Please install SOPS (https://github.com/mozilla/sops)")
+        return False
+    except Exception:
+        logger.exception("Error during SOPS encryption of .to-sops.yaml files")
+        return False
 
-        for file_path in to_sops_files:
-            # Generate the output filename (.sops.yaml)
-            base_name = os.path.basename(file_path)
-            if base_name.endswith(".to-sops.yaml"):
-                output_name = base_name[:-13] + ".sops.yaml"  # Remove .to-sops.yaml and add .sops.yaml
-                output_path = os.path.join(directory, output_name)
 
-                # Encrypt the file using SOPS
-                cmd = ["sops", "--encrypt", "--age", public_key, file_path]
-                logger.debug(f"Running SOPS encryption command: {' '.join(cmd)}")
+async def encrypt_to_sops_files_async(directory: str, public_key: str) -> bool:
+    """
+    Encrypt all .to-sops.yaml files in a directory using SOPS without blocking the event loop.
+
+    Same behaviour as encrypt_to_sops_files, with at most one SOPS process per CPU at a time.
+
+    Args:
+        directory: Directory containing .to-sops.yaml files
+        public_key: The AGE public key for encryption
 
-                process = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=False)
+    Returns:
+        True if all files were encrypted successfully, False otherwise
+    """
 
-                if process.returncode != 0:
-                    error_msg = process.stderr.strip()
-                    logger.error(f"SOPS encryption failed for {file_path}: {error_msg}")
-                    return False
+    try:
+        to_sops_files = _find_to_sops_files(directory)
+        if not to_sops_files:
+            return True
 
-                # Write the encrypted content to the output file
-                with open(output_path, "w") as f:
-                    f.write(process.stdout)
+        semaphore = asyncio.Semaphore(os.cpu_count() or 1)
 
-                # Remove the original .to-sops.yaml file
-                os.remove(file_path)
-                logger.info(f"Successfully encrypted {file_path} -> {output_path}")
+        async def encrypt(file_path: str, temp_path: str) -> subprocess.CompletedProcess[str]:
+            async with semaphore:
+                with open(temp_path, "wb") as output:
+                    return await _run_command_async(_sops_age_encrypt_cmd(file_path, public_key), stdout=output)
 
-        return True
+        temp_paths = _create_sops_temp_outputs(to_sops_files)
+        try:
+            # Wait for every run before cleaning up, also when one of them raises
+            results = await asyncio.gather(
+                *(
+                    encrypt(file_path, temp_path)
+                    for file_path, temp_path in zip(to_sops_files, temp_paths, strict=True)
+                ),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            processes = cast(list[subprocess.CompletedProcess[str]], results)
+            return _finish_sops_results(to_sops_files, temp_paths, processes)
+        finally:
+            _remove_sops_temp_outputs(temp_paths)
 
     except FileNotFoundError:
         logger.exception("sops command not found. Please install SOPS (https://github.com/mozilla/sops)")
@@ -146,10 +379,60 @@ def encrypt_to_sops_files(directory: str, public_key: str) -> bool:
         return False
 
 
+# Bech32 (BIP 173) alphabet and checksum generator, the encoding age uses for its keys
+_BECH32_CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
+_BECH32_GENERATOR = (0x3B6A57B2, 0x26508E6D, 0x1EA119FA, 0x3D4233DD, 0x2A1462B3)
+
+
+def _bech32_polymod(values: list[int]) -> int:
+    checksum = 1
+    for value in values:
+        top = checksum >> 25
+        checksum = (checksum & 0x1FFFFFF) << 5 ^ value
+        for i, generator in enumerate(_BECH32_GENERATOR):
+            if (top >> i) & 1:
+                checksum ^= generator
+    return checksum
+
+
+def _bech32_encode(hrp: str, data: bytes) -> str:
+    """
+    Encode bytes as a Bech32 string with the given human-readable part.
+
+    Args:
+        hrp: Human-readable prefix, e.g. "age"
+        data: The payload to encode
+
+    Returns:
+        The lowercase Bech32 string
+    """
+    # Regroup the 8-bit payload into 5-bit words, zero padding the last one
+    words = []
+    accumulator = 0
+    bits = 0
+    for byte in data:
+        accumulator = (accumulator << 8) | byte
+        bits += 8
+        while bits >= 5:
+            bits -= 5
+            words.append((accumulator >> bits) & 31)
+    if bits:
+        words.append((accumulator << (5 - bits)) & 31)
+
+    expanded_hrp = [ord(c) >> 5 for c in hrp] + [0] + [ord(c) & 31 for c in hrp]
+    polymod = _bech32_polymod(expanded_hrp + words + [0] * 6) ^ 1
+    checksum = [(polymod >> 5 * (5 - i)) & 31 for i in range(6)]
+
+    return hrp + "1" + "".join(_BECH32_CHARSET[word] for word in words + checksum)
+
+
 def generate_sops_key_pair() -> tuple[str, str]:
     """
     Generate a new SOPS AGE key pair.
 
+    The X25519 key pair is generated in-process and encoded the way age-keygen does, so no
+    external process or temporary key file is needed.
+
     Returns:
         Tuple of (private_key, public_key)
 
@@ -157,52 +440,31 @@ def generate_sops_key_pair() -> tuple[str, str]:
         SOPSKeyEncryptionError: When key generation fails
     """
     try:
-        # Create a unique temporary file that doesn't exist yet
-        temp_dir = tempfile.gettempdir()
-        temp_file_path = os.path.join(temp_dir, f"age_key_{uuid.uuid4().hex}")
+        identity = X25519PrivateKey.generate()
+        private_key = _bech32_encode("age-secret-key-", identity.private_bytes_raw()).upper()
+        public_key = _bech32_encode("age", identity.public_key().public_bytes_raw())
 
-        try:
-            # Generate age key pair
-            result = subprocess.run(["age-keygen", "-o", temp_file_path], capture_output=True, text=True, check=True)
+        logger.debug("Successfully generated SOPS AGE key pair")
+        return private_key, public_key
 
-            # Read the generated private key
-            with open(temp_file_path) as f:
-                private_key_content = f.read().strip()
-
-            # Extract public key from stderr (age-keygen outputs it there)
-            public_key = None
-            for line in result.stderr.splitlines():
-                if line.startswith("Public key: "):
-                    public_key = line.replace("Public key: ", "").strip()
-                    break
+    except Exception as e:
+        raise SOPSKeyEncryptionError(f"Failed to generate SOPS key pair: {e}") from e
 
-            if not public_key:
-                raise SOPSKeyEncryptionError("Failed to extract public key from age-keygen output")
 
-            # Extract private key (should be the AGE-SECRET-KEY line)
-            private_key = None
-            for line in private_key_content.splitlines():
-                if line.startswith("AGE-SECRET-KEY-"):
-                    private_key = line.strip()
-                    break
+async def generate_sops_key_pair_async() -> tuple[str, str]:
+    """
+    Generate a new SOPS AGE key pair from async code.
 
-            if not private_key:
-                raise SOPSKeyEncryptionError("Failed to extract private key from generated content")
+    Key generation happens in-process and takes microseconds, so this simply wraps
+    generate_sops_key_pair for callers that await it.
 
-            logger.debug("Successfully generated SOPS AGE key pair")
-            return private_key, public_key
+    Returns:
+        Tuple of (private_key, public_key)
 
-        finally:
-            # Clean up temp file
-            try:
-                os.unlink(temp_file_path)
-            except OSError:
-                pass
-
-    except subprocess.CalledProcessError as e:
-        raise SOPSKeyEncryptionError(f"age-keygen command failed: {e.stderr}") from e
-    except Exception as e:
-        raise SOPSKeyEncryptionError(f"Failed to generate SOPS key pair: {e}") from e
+    Raises:
+        SOPSKeyEncryptionError: When key generation fails
+    """
+    return generate_sops_key_pair()
 
 
 async def generate_and_encrypt_sops_key_pair() -> tuple[str, str, str]:
@@ -214,7 +476,7 @@ async def generate_and_encrypt_sops_key_pair() -> tuple[str, str, str]:
         SOPSKeyEncryptionError: When key generation or encryption fails
     """
     try:
-        private_key, public_key = generate_sops_key_pair()
+        private_key, public_key = await generate_sops_key_pair_async()
         encrypted_private_key = await encrypt_age_content(private_key, settings.SOPS_AGE_PUBLIC_KEY)
         return private_key, encrypted_private_key, public_key
     except Exception as e:
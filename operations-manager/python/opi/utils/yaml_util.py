@@ -4,15 +4,103 @@ Generic YAML utility module for loading, finding, and updating YAML files using
 This module provides centralized utilities for YAML file operations using JSONPath expressions.
 """
 
+import copy
 import logging
 import os
+import re
+import tempfile
+from collections import OrderedDict
+from functools import lru_cache
+from io import BytesIO, StringIO
 from typing import Any
 
+from jsonpath_ng import JSONPath
+from jsonpath_ng.exceptions import JSONPathError
 from jsonpath_ng.ext import parse as jsonpath_parse
 from ruamel.yaml import YAML
+from ruamel.yaml.error import YAMLError
 
 logger = logging.getLogger(__name__)
 
+# Shared round-trip YAML instance; ruamel resets its state after every load/dump, so one
+# configured instance can serve all calls made from the event loop
+_YAML = YAML()
+_YAML.preserve_quotes = True
+_YAML.width = 4096
+_YAML.default_flow_style = False
+
+# Read-only loader backed by libyaml; returns plain dicts/lists without comment or quote preservation
+_SAFE_YAML = YAML(typ="safe", pure=False)
+
+# Parsed documents keyed by (realpath, st_mtime_ns, st_size); callers get a deep copy so in-place
+# updates never leak back into the cache
+_YAML_CACHE_MAX_ENTRIES = 256
+_yaml_cache: OrderedDict[tuple[str, int, int], Any] = OrderedDict()
+
+
+# JSONPaths made of plain keys and list indices only, e.g. "$.spec.template.spec.containers[0].image";
+# these are resolved by walking the data directly instead of through jsonpath_ng
+_SIMPLE_JSONPATH_RE = re.compile(r"(?:\$\.)?[A-Za-z_][A-Za-z0-9_-]*(?:\.[A-Za-z_][A-Za-z0-9_-]*|\[\d+\])*")
+_SIMPLE_JSONPATH_STEP_RE = re.compile(r"\.?([A-Za-z_][A-Za-z0-9_-]*)|\[(\d+)\]")
+# Identifiers the jsonpath_ng lexer treats as keywords, so they never name a plain key
+_JSONPATH_KEYWORDS = frozenset({"where", "wherenot", "true", "false"})
+
+# Returned when the data has a shape the simple walk does not mirror jsonpath_ng for
+_FALLBACK = object()
+
+
+@lru_cache(maxsize=1024)
+def _parse_jsonpath(json_path: str) -> JSONPath:
+    """Parse a JSONPath expression, memoized because the same paths are queried over and over."""
+    return jsonpath_parse(json_path)
+
+
+@lru_cache(maxsize=1024)
+def _simple_jsonpath_steps(json_path: str) -> tuple[str | int, ...] | None:
+    """Split a JSONPath of plain keys and list indices into its steps, or return None if jsonpath_ng is needed."""
+    if not _SIMPLE_JSONPATH_RE.fullmatch(json_path):
+        return None
+
+    steps: list[str | int] = []
+    for key, index in _SIMPLE_JSONPATH_STEP_RE.findall(json_path.removeprefix("$")):
+        if key in _JSONPATH_KEYWORDS:
+            return None
+        steps.append(key or int(index))
+    return tuple(steps)
+
+
+def _locate_simple(data: Any, steps: tuple[str | int, ...]) -> Any:
+    """
+    Walk data along simple JSONPath steps.
+
+    Returns:
+        (container, last step) holding the value, None if the path does not exist, or _FALLBACK
+        when a step hits a type only jsonpath_ng knows how to handle (e.g. indexing a string)
+    """
+    container = None
+    current = data
+    for step in steps:
+        if isinstance(step, str):
+            if not isinstance(current, dict):
+                return None if isinstance(current, list) or current is None else _FALLBACK
+            if step not in current:
+                return None
+        else:
+            if not isinstance(current, list):
+                return None if isinstance(current, dict) or current is None else _FALLBACK
+            if step >= len(current):
+                return None
+        container = current
+        current = current[step]
+    return container, steps[-1]
+
+
+def _invalidate_yaml_cache(file_path: str) -> None:
+    """Drop all cached documents for the given file, whatever mtime/size they were cached under."""
+    real_path = os.path.realpath(file_path)
+    for key in [key for key in _yaml_cache if key[0] == real_path]:
+        del _yaml_cache[key]
+
 
 def load_yaml_from_path(file_path: str) -> dict[str, Any] | None:
     """
@@ -25,20 +113,28 @@ def load_yaml_from_path(file_path: str) -> dict[str, Any] | None:
         Parsed YAML data as dictionary, or None if loading failed
     """
     try:
-        if not os.path.exists(file_path):
-            logger.error(f"YAML file not found: {file_path}")
-            return None
-
-        yaml = YAML()
-        yaml.preserve_quotes = True
-        yaml.width = 4096
+        st = os.stat(file_path)
+        key = (os.path.realpath(file_path), st.st_mtime_ns, st.st_size)
+        cached = _yaml_cache.get(key)
+        if cached is not None:
+            _yaml_cache.move_to_end(key)
+            return copy.deepcopy(cached)
 
         with open(file_path, encoding="utf-8") as f:
-            data = yaml.load(f)
+            data = _YAML.load(f)
+
+        if data is not None:
+            _yaml_cache[key] = data
+            if len(_yaml_cache) > _YAML_CACHE_MAX_ENTRIES:
+                _yaml_cache.popitem(last=False)
+            return copy.deepcopy(data)
 
         return data
 
-    except Exception as e:
+    except FileNotFoundError:
+        logger.error(f"YAML file not found: {file_path}")
+        return None
+    except (OSError, UnicodeDecodeError, YAMLError) as e:
         logger.exception(f"Error loading YAML file {file_path}: {e}")
         return None
 
@@ -55,21 +151,37 @@ def save_yaml_to_path(file_path: str, data: dict[str, Any]) -> bool:
         True if save was successful, False otherwise
     """
     try:
-        yaml = YAML()
-        yaml.preserve_quotes = True
-        yaml.width = 4096
-        yaml.default_flow_style = False
-
         # Ensure directory exists
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-
-        with open(file_path, "w", encoding="utf-8") as f:
-            yaml.dump(data, f)
+        directory = os.path.dirname(file_path)
+        os.makedirs(directory, exist_ok=True)
+
+        # Render in memory and write it in one go to a sibling temp file, then swap it in so a
+        # crash halfway never leaves a truncated manifest behind
+        buffer = BytesIO()
+        _YAML.dump(data, buffer)
+        payload = buffer.getvalue()
+
+        try:
+            mode = os.stat(file_path).st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o644
+
+        fd, tmp_path = tempfile.mkstemp(dir=directory or ".", prefix=".tmp-", suffix=".yaml")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.chmod(tmp_path, mode)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        _invalidate_yaml_cache(file_path)
 
         logger.debug(f"Successfully saved YAML to: {file_path}")
         return True
 
-    except Exception as e:
+    except (OSError, YAMLError) as e:
         logger.exception(f"Error saving YAML file {file_path}: {e}")
         return False
 
@@ -90,12 +202,21 @@ def find_value_by_jsonpath(data: dict[str, Any], json_path: str, default: Any =
         if not data:
             return default
 
-        jsonpath_expr = jsonpath_parse(json_path)
+        steps = _simple_jsonpath_steps(json_path)
+        if steps is not None:
+            location = _locate_simple(data, steps)
+            if location is None:
+                return default
+            if location is not _FALLBACK:
+                container, step = location
+                return container[step]
+
+        jsonpath_expr = _parse_jsonpath(json_path)
         matches = jsonpath_expr.find(data)
 
         return matches[0].value if matches else default
 
-    except Exception as e:
+    except JSONPathError as e:
         logger.error(f"Error querying JSONPath '{json_path}': {e}")
         return default
 
@@ -111,17 +232,32 @@ def load_yaml_from_string(yaml_string: str) -> dict[str, Any] | None:
         Parsed YAML data as dictionary, or None if parsing failed
     """
     try:
-        yaml = YAML()
-        yaml.preserve_quotes = True
-        yaml.width = 4096
+        data = _YAML.load(StringIO(yaml_string))
 
-        from io import StringIO
+        return data
 
-        data = yaml.load(StringIO(yaml_string))
+    except YAMLError as e:
+        logger.exception(f"Error parsing YAML string: {e}")
+        return None
 
-        return data
 
-    except Exception as e:
+def load_yaml_from_string_fast(yaml_string: str) -> dict[str, Any] | None:
+    """
+    Load YAML content from a string with the C-accelerated safe loader.
+
+    Use this for data that is only read; the result cannot be dumped back with comments
+    and quoting intact, use load_yaml_from_string for round trips.
+
+    Args:
+        yaml_string: YAML content as string
+
+    Returns:
+        Parsed YAML data as dictionary, or None if parsing failed
+    """
+    try:
+        return _SAFE_YAML.load(yaml_string)
+
+    except YAMLError as e:
         logger.exception(f"Error parsing YAML string: {e}")
         return None
 
@@ -137,19 +273,12 @@ def dump_yaml_to_string(data: dict[str, Any]) -> str:
         YAML content as string
     """
     try:
-        yaml = YAML()
-        yaml.preserve_quotes = True
-        yaml.width = 4096
-        yaml.default_flow_style = False
-
-        from io import StringIO
-
         output = StringIO()
-        yaml.dump(data, output)
+        _YAML.dump(data, output)
 
         return output.getvalue()
 
-    except Exception as e:
+    except YAMLError as e:
         logger.exception(f"Error dumping YAML to string: {e}")
         return ""
 
@@ -171,7 +300,19 @@ def update_value_by_jsonpath(data: dict[str, Any], json_path: str, new_value: An
             logger.error("Cannot update value in empty data")
             return False
 
-        jsonpath_expr = jsonpath_parse(json_path)
+        steps = _simple_jsonpath_steps(json_path)
+        location = _locate_simple(data, steps) if steps is not None else _FALLBACK
+        if location is None:
+            logger.error(f"JSONPath '{json_path}' not found in data")
+            return False
+        if location is not _FALLBACK:
+            container, step = location
+            container[step] = new_value
+
+            logger.debug(f"Successfully updated JSONPath '{json_path}' to: {new_value}")
+            return True
+
+        jsonpath_expr = _parse_jsonpath(json_path)
         matches = jsonpath_expr.find(data)
 
         if not matches:
@@ -184,6 +325,6 @@ def update_value_by_jsonpath(data: dict[str, Any], json_path: str, new_value: An
         logger.debug(f"Successfully updated JSONPath '{json_path}' to: {new_value}")
         return True
 
-    except Exception as e:
+    except JSONPathError as e:
         logger.exception(f"Error updating JSONPath '{json_path}': {e}")
         return False
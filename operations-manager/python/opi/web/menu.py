@@ -5,47 +5,61 @@ This module provides functions for generating navigation menu items
 that are used across different web routes.
 """
 
+from functools import lru_cache
 from typing import Any
 
+# Menu entries that are the same for every request; shared between responses, so never mutate them
+_BASE_MENU_ITEMS: tuple[dict[str, str], ...] = (
+    {"label": "Dashboard", "link": "/dashboard", "icon": "home"},
+    {"label": "Projecten", "link": "/projects", "icon": "applicatie"},
+    {"label": "Nieuw Project", "link": "/projects/new", "icon": "plus"},
+    {"label": "Services", "link": "/services", "icon": "server"},
+    {"label": "Architecture", "link": "/architecture", "icon": "info"},
+    {"label": "API Docs", "link": "/docs", "icon": "computercode"},
+)
+_LOGOUT_MENU_ITEM = {"label": "Uitloggen", "link": "/auth/logout", "icon": "uitgang", "align": "right"}
+_LOGIN_MENU_ITEM = {"label": "Inloggen", "link": "/auth/login", "icon": "sleutel", "align": "right"}
 
-def get_menu_items(user: dict[str, Any] | None = None) -> list[dict[str, str]]:
+
+@lru_cache(maxsize=256)
+def _menu_for(user_label: str | None) -> tuple[dict[str, str], ...]:
+    """
+    Build the menu for a logged-in user with the given account label, or for an anonymous visitor.
+
+    Args:
+        user_label: Label of the account menu item, or None when nobody is logged in
+
+    Returns:
+        Tuple of menu item dictionaries, shared between all calls with the same label
+    """
+    if user_label is None:
+        return (*_BASE_MENU_ITEMS, _LOGIN_MENU_ITEM)
+
+    account_item = {"label": user_label, "link": "/account", "icon": "user", "align": "right"}
+    return (*_BASE_MENU_ITEMS, account_item, _LOGOUT_MENU_ITEM)
+
+
+def get_menu_items(user: dict[str, Any] | None = None) -> tuple[dict[str, str], ...]:
     """
     Get the menu items for the navigation bar.
 
+    The result is cached per account label and shared between requests; callers that need to
+    change it should make a list copy first.
+
     Args:
         user: User information dictionary from session (optional)
 
     Returns:
-        List of menu item dictionaries with label, link, icon, and optional align
+        Tuple of menu item dictionaries with label, link, icon, and optional align
     """
+    if not user:
+        return _menu_for(None)
+
     # Determine the user label for the account menu item
-    if user and user.get("name"):
-        user_label = user["name"]
-    elif user and user.get("email"):
+    if user.get("name"):
+        return _menu_for(user["name"])
+    if user.get("email"):
         # Fallback to email if no name available
-        user_label = user["email"]
-    else:
-        # Fallback to default text if no user info
-        user_label = "Mijn Account"
-
-    menu_items = [
-        {"label": "Dashboard", "link": "/dashboard", "icon": "home"},
-        {"label": "Projecten", "link": "/projects", "icon": "applicatie"},
-        {"label": "Nieuw Project", "link": "/projects/new", "icon": "plus"},
-        {"label": "Services", "link": "/services", "icon": "server"},
-        {"label": "Architecture", "link": "/architecture", "icon": "info"},
-        {"label": "API Docs", "link": "/docs", "icon": "computercode"},
-    ]
-
-    # Add user-specific menu items
-    if user:
-        menu_items.extend(
-            [
-                {"label": user_label, "link": "/account", "icon": "user", "align": "right"},
-                {"label": "Uitloggen", "link": "/auth/logout", "icon": "uitgang", "align": "right"},
-            ]
-        )
-    else:
-        menu_items.append({"label": "Inloggen", "link": "/auth/login", "icon": "sleutel", "align": "right"})
-
-    return menu_items
+        return _menu_for(user["email"])
+    # Fallback to default text if no user info
+    return _menu_for("Mijn Account")
@@ -2,19 +2,42 @@
 Web routes for serving HTML pages (non-API endpoints).
 """
 
-import copy
+import asyncio
+import hashlib
+import json
 import logging
+import re
+import traceback
+from collections.abc import AsyncIterator
+from typing import Any
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException, Request
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Request, Response
+from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse, StreamingResponse
+from starlette.datastructures import FormData
+from starlette.types import Message
 
 from opi.api.router import SelfServiceComponent, SelfServiceProjectRequest
 from opi.core.auth_decorators import get_current_user, requires_sso
-from opi.core.task_manager import create_task
-from opi.core.templates import get_templates
+from opi.core.cluster_config import get_ingress_postfix, get_ingress_tls_enabled
+from opi.core.config import settings
+from opi.core.simple_background import process_project_background
+from opi.core.task_manager import (
+    _project_managers,
+    _projects,
+    create_task,
+    get_task,
+    unwatch_project,
+    watch_project,
+)
+from opi.core.templates import format_template_error, get_templates
+from opi.handlers.project_file_handler import ProjectFileHandler
+from opi.manager.project_manager import create_project_manager
+from opi.services.project_service import get_project_service
+from opi.services.services import ServiceAdapter
 from opi.utils.age import decrypt_password_smart, get_global_private_key
+from opi.utils.naming import generate_ingress_map, generate_public_url
 from opi.utils.project_names import generate_project_name
-from opi.utils.yaml_util import load_yaml_from_string
+from opi.utils.yaml_util import load_yaml_from_string_fast
 from opi.web.menu import get_menu_items
 
 from ..utils.age import decrypt_age_content
@@ -25,10 +48,129 @@ logger = logging.getLogger(__name__)
 
 web_router = APIRouter()
 
+# Dynamic component form fields: components[<index>][<field>], with a trailing [] for multi-value fields
+_COMPONENT_FIELD_RE = re.compile(r"components\[(\d+)\]\[(\w+)\](\[\])?")
+
+# Upper bound for a self-service form submission; a project with dozens of components stays far below it
+_MAX_FORM_BODY_BYTES = 1024 * 1024
+
+# Seconds a progress stream waits for a change before checking the client is still connected
+_TASK_STREAM_HEARTBEAT_SECONDS = 15
+
+# Demo pages without per-request context, rendered once: template name -> (body, ETag)
+_static_pages: dict[str, tuple[bytes, str]] = {}
+
 # Include the services router
 web_router.include_router(services_router)
 
 
+async def _read_bounded_form(request: Request) -> FormData:
+    """
+    Parse a form submission, refusing bodies larger than _MAX_FORM_BODY_BYTES.
+
+    The declared Content-Length is checked up front, but chunked requests have none and the header
+    can understate the body, so the received bytes are also counted while the form is parsed.
+
+    Args:
+        request: The incoming request
+
+    Returns:
+        Parsed form data, without file parts
+
+    Raises:
+        HTTPException: 413 when the body exceeds the limit
+    """
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > _MAX_FORM_BODY_BYTES:
+        raise HTTPException(status_code=413, detail="Form submission too large")
+
+    received = 0
+
+    async def receive() -> Message:
+        nonlocal received
+        message = await request.receive()
+        if message["type"] == "http.request":
+            received += len(message.get("body", b""))
+            if received > _MAX_FORM_BODY_BYTES:
+                raise HTTPException(status_code=413, detail="Form submission too large")
+        return message
+
+    return await Request(request.scope, receive).form(max_files=0)
+
+
+def _collect_component_fields(form_data: FormData) -> dict[int, dict[str, Any]]:
+    """
+    Group the dynamic components[i][...] form fields by component index in one pass over the form.
+
+    Args:
+        form_data: The submitted form
+
+    Returns:
+        Mapping of component index to its fields; multi-value fields (name ending in []) are lists
+    """
+    components: dict[int, dict[str, Any]] = {}
+    for key, value in form_data.multi_items():
+        match = _COMPONENT_FIELD_RE.fullmatch(key)
+        if not match:
+            continue
+
+        fields = components.setdefault(int(match.group(1)), {})
+        if match.group(3):
+            fields.setdefault(match.group(2), []).append(value)
+        else:
+            fields[match.group(2)] = value
+    return components
+
+
+def _parse_port(value: Any) -> int | None:
+    """
+    Parse a submitted component port.
+
+    Args:
+        value: The raw form value, if any
+
+    Returns:
+        The port as an integer, or None when it is empty or not a number
+    """
+    if value is None:
+        return None
+    port = str(value).strip()
+    return int(port) if port.isascii() and port.isdigit() else None
+
+
+def _render_static_page(request: Request, template_name: str, context: dict[str, Any]) -> Response:
+    """
+    Serve a page whose content does not depend on the request.
+
+    Outside debug mode the page is rendered on first use and then served from memory with an ETag,
+    so browsers revalidate with If-None-Match and get a 304 while the page is unchanged.
+
+    Args:
+        request: The FastAPI request object
+        template_name: Template to render
+        context: Template context, apart from the request
+
+    Returns:
+        HTML response with the page, or an empty 304 response if the client's copy is current
+    """
+    if settings.DEBUG:
+        return get_templates().TemplateResponse(template_name, {"request": request, **context})
+
+    page = _static_pages.get(template_name)
+    if page is None:
+        body = get_templates().get_template(template_name).render({"request": request, **context}).encode()
+        page = (body, f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"')
+        _static_pages[template_name] = page
+
+    body, etag = page
+    # The pages sit behind SSO, so only the browser may keep a copy
+    headers = {"ETag": etag, "Cache-Control": "private, max-age=300"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if if_none_match.strip() == "*" or etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(content=body, headers=headers)
+
+
 @web_router.get("/")
 async def root():
     """
@@ -94,8 +236,9 @@ async def process_self_service_form(request: Request, background_tasks: Backgrou
         user = get_current_user(request)
         logger.info(f"Processing self-service form submission by user: {user.get('email', 'unknown')}")
 
-        # Parse form data
-        form_data = await request.form()
+        # Parse form data; the form is url-encoded without file inputs, so refuse oversized bodies
+        # and file parts instead of buffering them
+        form_data = await _read_bounded_form(request)
         logger.debug(f"Received form data keys: {list(form_data.keys())}")
 
         # Extract project details
@@ -124,28 +267,22 @@ async def process_self_service_form(request: Request, background_tasks: Backgrou
         # Extract services (checkboxes)
         services = form_data.getlist("services[]")
 
-        # Extract components - this is more complex as it's dynamic
+        # Extract components - this is more complex as it's dynamic; components removed in the form leave
+        # gaps in the indices, so every index that has a type is taken, in index order
         components = []
-        component_index = 0
-        while True:
-            # Check if we have component data for this index
-            comp_type_key = f"components[{component_index}][type]"
-            if comp_type_key not in form_data:
-                break
-
-            comp_type = str(form_data.get(comp_type_key, "deployment")).strip()
-            comp_port = form_data.get(f"components[{component_index}][port]")
-            comp_image = str(form_data.get(f"components[{component_index}][image]", "")).strip()
-            comp_cpu = str(form_data.get(f"components[{component_index}][cpu_limit]", "")).strip()
-            comp_memory = str(form_data.get(f"components[{component_index}][memory_limit]", "")).strip()
-            comp_env_vars = str(form_data.get(f"components[{component_index}][env_vars]", "")).strip()
-            comp_services = form_data.getlist(f"components[{component_index}][services][]")
-
-            # Parse port as integer
-            try:
-                port = int(str(comp_port)) if comp_port and str(comp_port).strip() else None
-            except ValueError:
-                port = None
+        for _, fields in sorted(_collect_component_fields(form_data).items()):
+            if "type" not in fields:
+                continue
+
+            comp_type = str(fields["type"]).strip()
+            comp_port = fields.get("port")
+            comp_image = str(fields.get("image", "")).strip()
+            comp_cpu = str(fields.get("cpu_limit", "")).strip()
+            comp_memory = str(fields.get("memory_limit", "")).strip()
+            comp_env_vars = str(fields.get("env_vars", "")).strip()
+            comp_services = fields.get("services", [])
+
+            port = _parse_port(comp_port)
 
             component = SelfServiceComponent(
                 type=comp_type,
@@ -157,7 +294,6 @@ async def process_self_service_form(request: Request, background_tasks: Backgrou
                 services=comp_services or None,
             )
             components.append(component)
-            component_index += 1
 
         # Create the request object
         project_data = SelfServiceProjectRequest(
@@ -179,8 +315,6 @@ async def process_self_service_form(request: Request, background_tasks: Backgrou
         task_id = create_task(display_name)
 
         # Start the background task with simple processor
-        from opi.core.simple_background import process_project_background
-
         background_tasks.add_task(process_project_background, task_id, project_data)
 
         logger.info(f"Started background task {task_id} for project {project_name}")
@@ -205,8 +339,6 @@ async def project_progress_page(request: Request, task_id: str):
     and automatically redirects when complete.
     """
     try:
-        from opi.core.task_manager import get_task
-
         # Get project info
         project = get_task(task_id)
         if not project:
@@ -236,111 +368,78 @@ async def project_progress_page(request: Request, task_id: str):
         raise HTTPException(status_code=500, detail=f"Error loading progress page: {e!s}")
 
 
-@web_router.get("/api/tasks/{task_id}/status")
-@requires_sso
-async def get_task_status(request: Request, task_id: str):
+def _build_task_status(task_id: str) -> dict[str, Any] | None:
     """
-    Get current task status and progress.
+    Build the progress snapshot of a project creation task, as shown on the progress page.
+
+    Args:
+        task_id: ID of the project creation task
 
-    This endpoint is used for polling by the progress page JavaScript.
+    Returns:
+        The status data, or None if the task is unknown
     """
-    try:
-        from opi.core.task_manager import TaskStatus, _project_managers, _projects
+    # Check if we have project info
+    if task_id not in _projects:
+        return None
+
+    project = _projects[task_id]
+
+    # Get the TaskProgressManager for this project
+    task_manager = _project_managers.get(task_id)
+
+    if task_manager:
+        task_hierarchy = task_manager.hierarchy_snapshot()
+        progress = task_manager.progress_percent()
+        logger.debug(f"Found TaskProgressManager for {task_id} with {len(task_manager.tasks)} tasks, {progress}% done")
+    else:
+        # No task manager yet, starting
+        logger.debug(f"No TaskProgressManager found for {task_id}")
+        task_hierarchy = []
+        progress = 0
 
-        # Check if we have project info
-        if task_id not in _projects:
-            raise HTTPException(status_code=404, detail="Project not found")
+    response_data = {
+        "task_id": task_id,
+        "status": project.status.value,
+        "current_step": project.current_step or "Starting...",
+        "project_name": project.project_name,
+        "created_at": project.created_at.isoformat(),
+        "progress": progress,
+        "tasks": task_hierarchy,
+    }
 
-        project = _projects[task_id]
+    # Add logs if available
+    if project.logs:
+        response_data["logs"] = project.logs[-50:]  # Last 50 lines
 
-        # Get the TaskProgressManager for this project
-        task_manager = _project_managers.get(task_id)
+    # Add events if available
+    if project.events:
+        response_data["events"] = project.events[-20:]  # Last 20 events
 
-        task_hierarchy = []
-        if task_manager:
-            logger.debug(f"Found TaskProgressManager for {task_id} with {len(task_manager.tasks)} tasks")
-            # Build the proper task hierarchy from this project's tasks
-            main_tasks = []
-            subtasks_by_parent = {}
-
-            # Organize this project's tasks
-            for task in task_manager.tasks.values():
-                if task.parent_id is None:
-                    # Main task
-                    main_tasks.append(task)
-                else:
-                    # Subtask
-                    if task.parent_id not in subtasks_by_parent:
-                        subtasks_by_parent[task.parent_id] = []
-                    subtasks_by_parent[task.parent_id].append(task)
-
-            # Build the hierarchy
-            for main_task in main_tasks:
-                task_data = {
-                    "id": main_task.id,
-                    "name": main_task.name,
-                    "status": main_task.status.value,
-                    "created_at": main_task.created_at.isoformat(),
-                    "completed_at": main_task.completed_at.isoformat() if main_task.completed_at else None,
-                    "error": main_task.error,
-                    "subtasks": [],
-                }
-
-                # Add subtasks if any
-                if main_task.id in subtasks_by_parent:
-                    for subtask in subtasks_by_parent[main_task.id]:
-                        task_data["subtasks"].append(
-                            {
-                                "id": subtask.id,
-                                "name": subtask.name,
-                                "status": subtask.status.value,
-                                "created_at": subtask.created_at.isoformat(),
-                                "completed_at": subtask.completed_at.isoformat() if subtask.completed_at else None,
-                                "error": subtask.error,
-                            }
-                        )
-
-                task_hierarchy.append(task_data)
-
-            # Calculate progress based on completed tasks
-            total_tasks = len(task_manager.tasks)
-            completed_tasks = sum(1 for t in task_manager.tasks.values() if t.status == TaskStatus.COMPLETED)
-            progress = int((completed_tasks / total_tasks * 100) if total_tasks > 0 else 0)
-            logger.debug(f"Progress: {completed_tasks}/{total_tasks} = {progress}%")
-        else:
-            # No task manager yet, starting
-            logger.debug(f"No TaskProgressManager found for {task_id}")
-            progress = 0
+    # Add namespace if available
+    if project.namespace:
+        response_data["namespace"] = project.namespace
 
-        response_data = {
-            "task_id": task_id,
-            "status": project.status.value,
-            "current_step": project.current_step or "Starting...",
-            "project_name": project.project_name,
-            "created_at": project.created_at.isoformat(),
-            "progress": progress,
-            "tasks": task_hierarchy,
-        }
+    # Add web addresses if available
+    if project.web_addresses:
+        response_data["web_addresses"] = project.web_addresses
 
-        # Add logs if available
-        if project.logs:
-            response_data["logs"] = project.logs[-50:]  # Last 50 lines
+    logger.debug(f"Built task status with {len(task_hierarchy)} tasks, progress={progress}")
+    return response_data
 
-        # Add events if available
-        if project.events:
-            response_data["events"] = project.events[-20:]  # Last 20 events
 
-        # Add namespace if available
-        if project.namespace:
-            response_data["namespace"] = project.namespace
-
-        # Add web addresses if available
-        if project.web_addresses:
-            response_data["web_addresses"] = project.web_addresses
+@web_router.get("/api/tasks/{task_id}/status")
+@requires_sso
+async def get_task_status(request: Request, task_id: str):
+    """
+    Get current task status and progress.
 
-        from fastapi.responses import JSONResponse
+    This endpoint is used for polling by the progress page JavaScript when server-sent events are unavailable.
+    """
+    try:
+        response_data = _build_task_status(task_id)
+        if response_data is None:
+            raise HTTPException(status_code=404, detail="Project not found")
 
-        logger.debug(f"Returning response with {len(task_hierarchy)} tasks, progress={progress}")
         return JSONResponse(content=response_data)
 
     except HTTPException:
@@ -350,6 +449,48 @@ async def get_task_status(request: Request, task_id: str):
         raise HTTPException(status_code=500, detail=f"Error getting task status: {e!s}")
 
 
+@web_router.get("/api/tasks/{task_id}/stream")
+@requires_sso
+async def stream_task_status(request: Request, task_id: str):
+    """
+    Stream task status and progress to the progress page as server-sent events.
+
+    A snapshot is sent when the stream opens and again only when the project changes, until the
+    project has completed or failed. Clients should fall back to polling /status if the stream fails.
+    """
+    if _build_task_status(task_id) is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    async def events() -> AsyncIterator[str]:
+        changed = watch_project(task_id)
+        try:
+            last_payload = None
+            while True:
+                changed.clear()
+                status = _build_task_status(task_id)
+                if status is None:
+                    return
+
+                payload = json.dumps(status, ensure_ascii=False, separators=(",", ":"))
+                if payload != last_payload:
+                    last_payload = payload
+                    yield f"data: {payload}\n\n"
+                if status["status"] in ("completed", "failed"):
+                    return
+
+                try:
+                    await asyncio.wait_for(changed.wait(), timeout=_TASK_STREAM_HEARTBEAT_SECONDS)
+                except TimeoutError:
+                    if await request.is_disconnected():
+                        return
+                    # Comment line; keeps proxies from closing an idle connection
+                    yield ": keep-alive\n\n"
+        finally:
+            unwatch_project(task_id, changed)
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
 @web_router.get("/api/tasks/{task_id}/debug")
 @requires_sso
 async def debug_task(request: Request, task_id: str):
@@ -359,8 +500,6 @@ async def debug_task(request: Request, task_id: str):
     This is useful for troubleshooting failed tasks.
     """
     try:
-        from opi.core.task_manager import _project_managers, _projects, get_task
-
         project = get_task(task_id)
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
@@ -376,8 +515,6 @@ async def debug_task(request: Request, task_id: str):
             "project_tasks_count": len(_project_managers.get(task_id).tasks) if task_id in _project_managers else 0,
         }
 
-        from fastapi.responses import JSONResponse
-
         return JSONResponse(content=debug_info)
 
     except HTTPException:
@@ -409,24 +546,10 @@ async def roos_project_form(request: Request):
             },
         )
     except Exception as e:
-        import traceback
-
         error_details = traceback.format_exc()
         logger.error(f"Error serving ROOS project form: {e!s}\n{error_details}")
 
-        # Try to extract line number from Jinja2 error
-        error_msg = str(e)
-        if hasattr(e, "lineno"):
-            error_msg = f"Line {e.lineno}: {error_msg}"
-
-        # Include template source snippet if available
-        if hasattr(e, "source") and hasattr(e, "lineno"):
-            lines = e.source.splitlines()
-            line_num = e.lineno - 1
-            if 0 <= line_num < len(lines):
-                error_msg += f"\nSource: {lines[line_num].strip()}"
-
-        raise HTTPException(status_code=500, detail=f"Template error: {error_msg}")
+        raise HTTPException(status_code=500, detail=f"Template error: {format_template_error(e)}")
 
 
 @web_router.post("/projects/delete/{project_name}")
@@ -447,11 +570,6 @@ async def delete_project_web(request: Request, project_name: str):
         JSON response with deletion results for AJAX consumption
     """
     try:
-        from fastapi.responses import JSONResponse
-
-        from opi.manager.project_manager import create_project_manager
-        from opi.services.project_service import get_project_service
-
         # Get current user from SSO
         user = get_current_user(request)
         user_email = user.get("email", "").lower()
@@ -462,12 +580,13 @@ async def delete_project_web(request: Request, project_name: str):
         project_service = get_project_service()
 
         # Check if project exists and user has access
-        if not project_service.is_user_authorized_for_project(project_name, user_email):
+        project = project_service.get_project(project_name)
+        user_role = project.role_for(user_email) if project else None
+        if user_role is None:
             logger.warning(f"User {user_email} not authorized to access project: {project_name}")
             return JSONResponse(content={"error": "You are not authorized to access this project"}, status_code=403)
 
         # Check if user has admin or owner role for deletion
-        user_role = project_service.get_user_role_for_project(project_name, user_email)
         if user_role not in ["admin", "owner"]:
             logger.warning(f"User {user_email} with role '{user_role}' cannot delete project: {project_name}")
             return JSONResponse(
@@ -494,7 +613,7 @@ async def delete_project_web(request: Request, project_name: str):
             # Project deletion was blocked due to deployments on other clusters
             status_code = 409  # Conflict - cannot complete due to conflicting state
             remaining_deployments = deletion_results["remaining_deployments"]
-            other_clusters = set(dep["cluster"] for dep in remaining_deployments)
+            other_clusters = list(dict.fromkeys(dep["cluster"] for dep in remaining_deployments))
             message = f"Project '{project_name}' cannot be deleted because it has deployments on other clusters: {', '.join(other_clusters)}"
             status = "blocked"
             logger.warning(
@@ -530,8 +649,7 @@ async def delete_project_web(request: Request, project_name: str):
 async def test_architecture(request: Request):
     """Test route for architecture components."""
     try:
-        templates = get_templates()
-        return templates.TemplateResponse("test-architecture.html.j2", {"request": request})
+        return _render_static_page(request, "test-architecture.html.j2", {})
     except Exception as e:
         logger.error(f"Error serving test architecture: {e!s}")
         raise HTTPException(status_code=500, detail=f"Template error: {e!s}")
@@ -542,8 +660,7 @@ async def test_architecture(request: Request):
 async def test_hero(request: Request):
     """Test route for hero component."""
     try:
-        templates = get_templates()
-        return templates.TemplateResponse("test-hero.html.j2", {"request": request})
+        return _render_static_page(request, "test-hero.html.j2", {})
     except Exception as e:
         logger.error(f"Error serving test hero: {e!s}")
         raise HTTPException(status_code=500, detail=f"Template error: {e!s}")
@@ -562,29 +679,12 @@ async def formulier_demo_form(request: Request):
         HTML response with the formulier demo form
     """
     try:
-        templates = get_templates()
-        return templates.TemplateResponse(
-            "formulier-template.html.j2", {"request": request, "title": "Formulier Template - RVO Demo"}
-        )
+        return _render_static_page(request, "formulier-template.html.j2", {"title": "Formulier Template - RVO Demo"})
     except Exception as e:
-        import traceback
-
         error_details = traceback.format_exc()
         logger.error(f"Error serving Formulier demo form: {e!s}\n{error_details}")
 
-        # Try to extract line number from Jinja2 error
-        error_msg = str(e)
-        if hasattr(e, "lineno"):
-            error_msg = f"Line {e.lineno}: {error_msg}"
-
-        # Include template source snippet if available
-        if hasattr(e, "source") and hasattr(e, "lineno"):
-            lines = e.source.splitlines()
-            line_num = e.lineno - 1
-            if 0 <= line_num < len(lines):
-                error_msg += f"\nSource: {lines[line_num].strip()}"
-
-        raise HTTPException(status_code=500, detail=f"Template error: {error_msg}")
+        raise HTTPException(status_code=500, detail=f"Template error: {format_template_error(e)}")
 
 
 @web_router.get("/dashboard", response_class=HTMLResponse)
@@ -602,24 +702,10 @@ async def dashboard(request: Request):
         return templates.TemplateResponse("dashboard.html.j2", {"request": request, "menu_items": get_menu_items(user)})
 
     except Exception as e:
-        import traceback
-
         error_details = traceback.format_exc()
         logger.error(f"Error serving dashboard: {e!s}\n{error_details}")
 
-        # Try to extract line number from Jinja2 error
-        error_msg = str(e)
-        if hasattr(e, "lineno"):
-            error_msg = f"Line {e.lineno}: {error_msg}"
-
-        # Include template source snippet if available
-        if hasattr(e, "source") and hasattr(e, "lineno"):
-            lines = e.source.splitlines()
-            line_num = e.lineno - 1
-            if 0 <= line_num < len(lines):
-                error_msg += f"\nSource: {lines[line_num].strip()}"
-
-        raise HTTPException(status_code=500, detail=f"Template error: {error_msg}")
+        raise HTTPException(status_code=500, detail=f"Template error: {format_template_error(e)}")
 
 
 @web_router.get("/projects/details/{project_name}", response_class=HTMLResponse)
@@ -637,9 +723,6 @@ async def project_details(request: Request, project_name: str):
         HTML response with detailed project information
     """
     try:
-        from opi.services.project_service import get_project_service
-        from opi.services.services import ServiceAdapter
-
         templates = get_templates()
         user = get_current_user(request)
         user_email = user.get("email", "").lower()
@@ -647,42 +730,44 @@ async def project_details(request: Request, project_name: str):
         # Get project service to validate access
         project_service = get_project_service()
 
-        # Check if user has access to this project
-        if not project_service.is_user_authorized_for_project(project_name, user_email):
+        # Check if user has access to this project, and with which role
+        project = project_service.get_project(project_name)
+        user_role = project.role_for(user_email) if project else None
+        if user_role is None:
             logger.warning(f"User {user_email} not authorized to view project: {project_name}")
             raise HTTPException(status_code=403, detail="You are not authorized to view this project")
 
-        # Get project details
-        project = project_service.get_project(project_name)
-        if not project:
-            raise HTTPException(status_code=404, detail=f"Project '{project_name}' not found")
-
-        # Get user's role for this project
-        user_role = project_service.get_user_role_for_project(project_name, user_email)
-
         # Use project data from memory if available
         project_data = project.data or {}
         settings_private_key = get_global_private_key()
 
-        project_data_decrypted = copy.deepcopy(project_data)
-
         project_private_key = await decrypt_password_smart(
             project_data["config"]["age-private-key"], settings_private_key
         )
 
-        project_data_decrypted["config"]["api-key"] = await decrypt_password_smart(
-            project_data["config"]["api-key"], project_private_key
+        # The page gets shallow copies of the config, deployments and components: those are the dicts that
+        # receive decrypted values and ingress links below. Anything nested is shared with the in-memory
+        # project data and must not be modified
+        deployments = [{**deployment} for deployment in project_data.get("deployments", [])]
+        components = [{**component} for component in project_data.get("components", [])]
+        encrypted_deployments = [deployment for deployment in deployments if deployment.get("configuration")]
+        encrypted_components = [component for component in components if component.get("user-env-vars")]
+
+        # Every decryption is an independent age process, so run them side by side
+        api_key, *decrypted_yamls = await asyncio.gather(
+            decrypt_password_smart(project_data["config"]["api-key"], project_private_key),
+            *(decrypt_age_content(d["configuration"], project_private_key) for d in encrypted_deployments),
+            *(decrypt_age_content(c["user-env-vars"], project_private_key) for c in encrypted_components),
         )
+        config = {**project_data["config"], "api-key": api_key}
 
-        for deployment in project_data_decrypted.get("deployments", []):
-            if deployment.get("configuration"):
-                decrypted_yaml = await decrypt_age_content(deployment["configuration"], project_private_key)
-                deployment["configuration"] = load_yaml_from_string(decrypted_yaml)
+        decrypted_configurations = decrypted_yamls[: len(encrypted_deployments)]
+        for deployment, decrypted_yaml in zip(encrypted_deployments, decrypted_configurations, strict=True):
+            deployment["configuration"] = load_yaml_from_string_fast(decrypted_yaml)
 
-        for component in project_data_decrypted.get("components", []):
-            if component.get("user-env-vars"):
-                decrypted_yaml = await decrypt_age_content(component["user-env-vars"], project_private_key)
-                component["user-env-vars"] = load_yaml_from_string(decrypted_yaml)
+        decrypted_env_vars = decrypted_yamls[len(encrypted_deployments) :]
+        for component, decrypted_yaml in zip(encrypted_components, decrypted_env_vars, strict=True):
+            component["user-env-vars"] = load_yaml_from_string_fast(decrypted_yaml)
 
         # Process services to add display information
         services_with_info = []
@@ -706,90 +791,77 @@ async def project_details(request: Request, project_name: str):
             "user_role": user_role,
             "services": services_with_info,
             "clusters": project_data.get("clusters", []),
-            "components": project_data_decrypted.get("components", []),
-            "deployments": project_data_decrypted.get("deployments", []),
+            "components": components,
+            "deployments": deployments,
             "repositories": project_data.get("repositories", []),
-            "config": project_data_decrypted.get("config", {}),
+            "config": config,
         }
 
-        # Add ingress URLs for components that have publish-on-web service
-        from opi.core.cluster_config import get_ingress_postfix, get_ingress_tls_enabled
-        from opi.handlers.project_file_handler import ProjectFileHandler
-        from opi.utils.naming import generate_ingress_map, generate_public_url
-
+        # Add ingress URLs for components that have publish-on-web service. The publish-on-web check and the
+        # cluster ingress settings are looked up once per component and cluster, not per deployment/component pair
         project_file_handler = ProjectFileHandler()
+        referenced_components = {
+            c.get("reference")
+            for deployment in project_details["deployments"]
+            for c in deployment.get("components", [])
+            if c.get("reference")
+        }
+        component_names = {c.get("name") for c in project_details["components"] if c.get("name")}
+        publishes_on_web = {
+            component_name: project_file_handler.extract_component_publish_on_web(project_data, component_name)
+            for component_name in component_names | referenced_components
+        }
 
-        # Add ingress links to deployments for components with publish-on-web
+        cluster_ingress: dict[str, tuple[str, bool] | None] = {}
+        for cluster in {deployment.get("cluster") for deployment in project_details["deployments"]}:
+            if not cluster:
+                continue
+            try:
+                cluster_ingress[cluster] = (get_ingress_postfix(cluster), get_ingress_tls_enabled(cluster))
+            except Exception as ingress_error:
+                logger.warning(f"Failed to get ingress settings for cluster {cluster}: {ingress_error}")
+                cluster_ingress[cluster] = None
+
+        # Add ingress links to deployments for components with publish-on-web. Each ingress is generated once and
+        # also collected per component, in deployment order, for the component links below
+        links_by_component: dict[str, list[dict[str, Any]]] = {}
         for deployment in project_details["deployments"]:
             cluster = deployment.get("cluster")
             deployment["ingress_links"] = []
 
-            if cluster:
+            if cluster and cluster_ingress[cluster]:
+                ingress_postfix, use_https = cluster_ingress[cluster]
+                linked_components = set()
                 try:
-                    ingress_postfix = get_ingress_postfix(cluster)
-                    use_https = get_ingress_tls_enabled(cluster)
-
                     for component in deployment.get("components", []):
                         component_name = component.get("reference")
-                        if component_name:
-                            # Check if component has publish-on-web service (same as project_manager)
-                            has_publish_on_web = project_file_handler.extract_component_publish_on_web(
-                                project_data, component_name
+                        if component_name and publishes_on_web[component_name]:
+                            # Generate ingress map exactly like project_manager does
+                            subdomain = deployment.get("subdomain")
+                            ingress_map = generate_ingress_map(
+                                component_name, deployment["name"], project_name, ingress_postfix, subdomain
                             )
 
-                            if has_publish_on_web:
-                                # Generate ingress map exactly like project_manager does
-                                subdomain = deployment.get("subdomain")
-                                ingress_map = generate_ingress_map(
-                                    component_name, deployment["name"], project_name, ingress_postfix, subdomain
-                                )
-
-                                # Create links for all ingress hostnames (default + subdomain if exists)
-                                for ingress_name, hostname in ingress_map.items():
-                                    public_url = generate_public_url(hostname, use_https)
-                                    deployment["ingress_links"].append(
-                                        {
-                                            "component_name": component_name,
-                                            "ingress_name": ingress_name,
-                                            "hostname": hostname,
-                                            "url": public_url,
-                                        }
-                                    )
-                except Exception as ingress_error:
-                    logger.warning(
-                        f"Failed to generate ingress links for deployment {deployment.get('name')}: {ingress_error}"
-                    )
-
-        # Add ingress links to components that have publish-on-web
-        for component in project_details["components"]:
-            component["ingress_links"] = []
-            component_name = component.get("name")
-
-            if component_name:
-                # Check if component has publish-on-web service (same as project_manager)
-                has_publish_on_web = project_file_handler.extract_component_publish_on_web(project_data, component_name)
-
-                if has_publish_on_web:
-                    # Find all deployments that use this component
-                    for deployment in project_details["deployments"]:
-                        cluster = deployment.get("cluster")
-                        if cluster and any(
-                            c.get("reference") == component_name for c in deployment.get("components", [])
-                        ):
-                            try:
-                                ingress_postfix = get_ingress_postfix(cluster)
-                                use_https = get_ingress_tls_enabled(cluster)
-
-                                # Generate ingress map exactly like project_manager does
-                                subdomain = deployment.get("subdomain")
-                                ingress_map = generate_ingress_map(
-                                    component_name, deployment["name"], project_name, ingress_postfix, subdomain
+                            # Create links for all ingress hostnames (default + subdomain if exists); a component listed
+                            # twice in a deployment gets its deployment links twice but its component links once
+                            component_links = (
+                                None
+                                if component_name in linked_components
+                                else links_by_component.setdefault(component_name, [])
+                            )
+                            linked_components.add(component_name)
+                            for ingress_name, hostname in ingress_map.items():
+                                public_url = generate_public_url(hostname, use_https)
+                                deployment["ingress_links"].append(
+                                    {
+                                        "component_name": component_name,
+                                        "ingress_name": ingress_name,
+                                        "hostname": hostname,
+                                        "url": public_url,
+                                    }
                                 )
-
-                                # Create links for all ingress hostnames (default + subdomain if exists)
-                                for ingress_name, hostname in ingress_map.items():
-                                    public_url = generate_public_url(hostname, use_https)
-                                    component["ingress_links"].append(
+                                if component_links is not None:
+                                    component_links.append(
                                         {
                                             "deployment_name": deployment["name"],
                                             "cluster": cluster,
@@ -798,112 +870,20 @@ async def project_details(request: Request, project_name: str):
                                             "url": public_url,
                                         }
                                     )
-                            except Exception as ingress_error:
-                                logger.warning(
-                                    f"Failed to generate ingress link for component {component_name} in deployment {deployment['name']}: {ingress_error}"
-                                )
-
-        return templates.TemplateResponse(
-            "project-details.html.j2",
-            {
-                "request": request,
-                "title": f"Project Details - {project_details['display_name']}",
-                "menu_items": get_menu_items(user),
-                "project": project_details,
-                "user": user,
-                "user_role": user_role,
-                "ServiceAdapter": ServiceAdapter,
-            },
-        )
-
-        # Generate ingress URLs for components with inbound ports
-        from opi.core.cluster_config import get_ingress_postfix, get_ingress_tls_enabled
-        from opi.utils.naming import generate_ingress_map, generate_public_url
-
-        # Add ingress information to deployments
-        for deployment in project_details["deployments"]:
-            cluster = deployment.get("cluster")
-            if cluster:
-                try:
-                    ingress_postfix = get_ingress_postfix(cluster)
-                    use_https = get_ingress_tls_enabled(cluster)
-                    deployment["ingress_links"] = []
-
-                    # Generate ingress links for each component in this deployment
-                    for component in deployment.get("components", []):
-                        component_name = component.get("reference")
-                        if component_name:
-                            # Find the component definition to check for inbound ports
-                            component_def = next(
-                                (c for c in project_details["components"] if c.get("name") == component_name), None
-                            )
-
-                            # Only create ingress links for components with inbound ports
-                            if component_def and component_def.get("ports", {}).get("inbound"):
-                                ingress_map = generate_ingress_map(
-                                    component_name,
-                                    deployment["name"],
-                                    project_name,
-                                    ingress_postfix,
-                                    deployment.get("subdomain"),
-                                )
-
-                                for ingress_name, hostname in ingress_map.items():
-                                    public_url = generate_public_url(hostname, use_https)
-                                    deployment["ingress_links"].append(
-                                        {
-                                            "component_name": component_name,
-                                            "ingress_name": ingress_name,
-                                            "hostname": hostname,
-                                            "url": public_url,
-                                        }
-                                    )
                 except Exception as ingress_error:
                     logger.warning(
                         f"Failed to generate ingress links for deployment {deployment.get('name')}: {ingress_error}"
                     )
-                    deployment["ingress_links"] = []
 
-        # Also add ingress information directly to components for the components section
+        # Add ingress links to components that have publish-on-web
         for component in project_details["components"]:
-            component["ingress_links"] = []
-            # Only show ingress links for components with inbound ports
-            if component.get("ports", {}).get("inbound"):
-                # Find deployments that use this component
-                for deployment in project_details["deployments"]:
-                    cluster = deployment.get("cluster")
-                    if cluster and any(
-                        c.get("reference") == component["name"] for c in deployment.get("components", [])
-                    ):
-                        try:
-                            ingress_postfix = get_ingress_postfix(cluster)
-                            use_https = get_ingress_tls_enabled(cluster)
-
-                            ingress_map = generate_ingress_map(
-                                component["name"],
-                                deployment["name"],
-                                project_name,
-                                ingress_postfix,
-                                deployment.get("subdomain"),
-                            )
-
-                            for ingress_name, hostname in ingress_map.items():
-                                public_url = generate_public_url(hostname, use_https)
-                                component["ingress_links"].append(
-                                    {
-                                        "deployment_name": deployment["name"],
-                                        "cluster": cluster,
-                                        "ingress_name": ingress_name,
-                                        "hostname": hostname,
-                                        "url": public_url,
-                                    }
-                                )
-                        except Exception as ingress_error:
-                            logger.warning(
-                                f"Failed to generate ingress links for component {component['name']} in deployment {deployment['name']}: {ingress_error}"
-                            )
+            component_name = component.get("name")
+            component["ingress_links"] = list(links_by_component.get(component_name, [])) if component_name else []
 
-        return templates.TemplateResponse(
+        # Projects with many deployments and components make for a large page; render it in a worker thread so
+        # other requests are not held up behind it
+        return await asyncio.to_thread(
+            templates.TemplateResponse,
             "project-details.html.j2",
             {
                 "request": request,
@@ -919,24 +899,10 @@ async def project_details(request: Request, project_name: str):
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-
         error_details = traceback.format_exc()
         logger.error(f"Error serving project details: {e!s}\n{error_details}")
 
-        # Try to extract line number from Jinja2 error
-        error_msg = str(e)
-        if hasattr(e, "lineno"):
-            error_msg = f"Line {e.lineno}: {error_msg}"
-
-        # Include template source snippet if available
-        if hasattr(e, "source") and hasattr(e, "lineno"):
-            lines = e.source.splitlines()
-            line_num = e.lineno - 1
-            if 0 <= line_num < len(lines):
-                error_msg += f"\nSource: {lines[line_num].strip()}"
-
-        raise HTTPException(status_code=500, detail=f"Template error: {error_msg}")
+        raise HTTPException(status_code=500, detail=f"Template error: {format_template_error(e)}")
 
 
 @web_router.get("/projects", response_class=HTMLResponse)
@@ -950,8 +916,6 @@ async def projects_overview(request: Request):
         HTML response with a table showing user's projects and their status
     """
     try:
-        from opi.services.project_service import get_project_service
-
         templates = get_templates()
         user = get_current_user(request)
         user_email = user.get("email", "").lower()
@@ -959,39 +923,33 @@ async def projects_overview(request: Request):
         # Get project service to filter by user access
         project_service = get_project_service()
 
-        # Get all projects and filter by user access
+        # Get the projects the user has access to
         user_projects = []
-        all_projects = project_service.get_all_projects()
+        for project, user_role in project_service.get_projects_for_user(user_email):
+            project_name = project.name
+            try:
+                # Use project data from memory if available
+                project_data = project.data or {}
 
-        for project_name, project in all_projects.items():
-            # Check if user has access to this project
-            if project_service.is_user_authorized_for_project(project_name, user_email):
-                try:
-                    # Get user's role for this project
-                    user_role = project_service.get_user_role_for_project(project_name, user_email)
-
-                    # Use project data from memory if available
-                    project_data = project.data or {}
-
-                    # Get description, filtering out the generic fallback text
-                    description = project_data.get("description", "")
-
-                    user_projects.append(
-                        {
-                            "name": project_name,
-                            "display_name": project_data.get("display-name", project_name),
-                            "description": description,
-                            "users": project.users or [],
-                            "user_role": user_role,
-                            "services": project_data.get("services", []),
-                            "clusters": project_data.get("clusters", []),
-                            "components": project_data.get("components", []),
-                            "deployments": project_data.get("deployments", []),
-                        }
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to load project data for {project_name}: {e}")
-                    continue
+                # Get description, filtering out the generic fallback text
+                description = project_data.get("description", "")
+
+                user_projects.append(
+                    {
+                        "name": project_name,
+                        "display_name": project_data.get("display-name", project_name),
+                        "description": description,
+                        "users": project.users or [],
+                        "user_role": user_role,
+                        "services": project_data.get("services", []),
+                        "clusters": project_data.get("clusters", []),
+                        "components": project_data.get("components", []),
+                        "deployments": project_data.get("deployments", []),
+                    }
+                )
+            except Exception as e:
+                logger.warning(f"Failed to load project data for {project_name}: {e}")
+                continue
 
         # Sort projects by name
         user_projects.sort(key=lambda p: p["display_name"] or p["name"])
@@ -1002,24 +960,10 @@ async def projects_overview(request: Request):
         )
 
     except Exception as e:
-        import traceback
-
         error_details = traceback.format_exc()
         logger.error(f"Error serving projects overview: {e!s}\n{error_details}")
 
-        # Try to extract line number from Jinja2 error
-        error_msg = str(e)
-        if hasattr(e, "lineno"):
-            error_msg = f"Line {e.lineno}: {error_msg}"
-
-        # Include template source snippet if available
-        if hasattr(e, "source") and hasattr(e, "lineno"):
-            lines = e.source.splitlines()
-            line_num = e.lineno - 1
-            if 0 <= line_num < len(lines):
-                error_msg += f"\nSource: {lines[line_num].strip()}"
-
-        raise HTTPException(status_code=500, detail=f"Template error: {error_msg}")
+        raise HTTPException(status_code=500, detail=f"Template error: {format_template_error(e)}")
 
 
 @web_router.get("/architecture", response_class=HTMLResponse)
@@ -1038,24 +982,10 @@ async def architecture_overview(request: Request):
         )
 
     except Exception as e:
-        import traceback
-
         error_details = traceback.format_exc()
         logger.error(f"Error serving architecture overview: {e!s}\n{error_details}")
 
-        # Try to extract line number from Jinja2 error
-        error_msg = str(e)
-        if hasattr(e, "lineno"):
-            error_msg = f"Line {e.lineno}: {error_msg}"
-
-        # Include template source snippet if available
-        if hasattr(e, "source") and hasattr(e, "lineno"):
-            lines = e.source.splitlines()
-            line_num = e.lineno - 1
-            if 0 <= line_num < len(lines):
-                error_msg += f"\nSource: {lines[line_num].strip()}"
-
-        raise HTTPException(status_code=500, detail=f"Template error: {error_msg}")
+        raise HTTPException(status_code=500, detail=f"Template error: {format_template_error(e)}")
 
 
 @web_router.get("/test-template-variables", response_class=HTMLResponse)
@@ -1090,21 +1020,7 @@ async def example_page(request: Request):
         )
 
     except Exception as e:
-        import traceback
-
         error_details = traceback.format_exc()
         logger.error(f"Error serving example page: {e!s}\n{error_details}")
 
-        # Try to extract line number from Jinja2 error
-        error_msg = str(e)
-        if hasattr(e, "lineno"):
-            error_msg = f"Line {e.lineno}: {error_msg}"
-
-        # Include template source snippet if available
-        if hasattr(e, "source") and hasattr(e, "lineno"):
-            lines = e.source.splitlines()
-            line_num = e.lineno - 1
-            if 0 <= line_num < len(lines):
-                error_msg += f"\nSource: {lines[line_num].strip()}"
-
-        raise HTTPException(status_code=500, detail=f"Template error: {error_msg}")
+        raise HTTPException(status_code=500, detail=f"Template error: {format_template_error(e)}")
@@ -7,7 +7,7 @@ import logging
 from fastapi import HTTPException, Request
 
 from opi.core.auth_decorators import get_current_user, requires_sso
-from opi.core.templates import get_templates
+from opi.core.templates import format_template_error, get_templates
 from opi.web.menu import get_menu_items
 
 logger = logging.getLogger(__name__)
@@ -43,16 +43,4 @@ async def self_service_portal(request: Request):
         error_details = traceback.format_exc()
         logger.error(f"Error serving Self-Service Portal form: {e!s}\n{error_details}")
 
-        # Try to extract line number from Jinja2 error
-        error_msg = str(e)
-        if hasattr(e, "lineno"):
-            error_msg = f"Line {e.lineno}: {error_msg}"
-
-        # Include template source snippet if available
-        if hasattr(e, "source") and hasattr(e, "lineno"):
-            lines = e.source.splitlines()
-            line_num = e.lineno - 1
-            if 0 <= line_num < len(lines):
-                error_msg += f"\nSource: {lines[line_num].strip()}"
-
-        raise HTTPException(status_code=500, detail=f"Template error: {error_msg}")
+        raise HTTPException(status_code=500, detail=f"Template error: {format_template_error(e)}")
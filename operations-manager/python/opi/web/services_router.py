@@ -8,7 +8,7 @@ from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse
 
 from opi.core.auth_decorators import get_current_user, requires_sso
-from opi.core.templates import get_templates
+from opi.core.templates import format_template_error, get_templates
 from opi.services.services import ServiceAdapter
 from opi.web.menu import get_menu_items
 
@@ -69,18 +69,6 @@ async def services_overview(request: Request):
         error_details = traceback.format_exc()
         logger.error(f"Error serving services overview: {e!s}\n{error_details}")
 
-        # Try to extract line number from Jinja2 error
-        error_msg = str(e)
-        if hasattr(e, "lineno"):
-            error_msg = f"Line {e.lineno}: {error_msg}"
-
-        # Include template source snippet if available
-        if hasattr(e, "source") and hasattr(e, "lineno"):
-            lines = e.source.splitlines()
-            line_num = e.lineno - 1
-            if 0 <= line_num < len(lines):
-                error_msg += f"\nSource: {lines[line_num].strip()}"
-
         from fastapi import HTTPException
 
-        raise HTTPException(status_code=500, detail=f"Template error: {error_msg}")
+        raise HTTPException(status_code=500, detail=f"Template error: {format_template_error(e)}")
@@ -0,0 +1,29 @@
+"""
+Test the cached naming generators.
+"""
+
+import logging
+
+from opi.utils.naming import generate_resource_identifier
+
+
+class TestGenerateResourceIdentifier:
+    """Test combining a project name and postfix into a resource identifier."""
+
+    def test_normalizes_separators(self):
+        """Inputs are lowercased and their separators normalized to the requested one."""
+        assert generate_resource_identifier("My-Project", "Front_End", "_") == "my_project_front_end"
+        assert generate_resource_identifier("My_Project", "Front-End", "-") == "my-project-front-end"
+
+    def test_every_truncation_is_logged(self, caplog):
+        """Repeated calls for the same long name warn each time, even though the join is cached."""
+        project_name = "p" * 60
+
+        with caplog.at_level(logging.WARNING, logger="opi.utils.naming"):
+            first = generate_resource_identifier(project_name, "deployment")
+            second = generate_resource_identifier(project_name, "deployment")
+
+        assert first == second == f"{project_name}_de"
+        assert [record.getMessage() for record in caplog.records].count(
+            f"Resource identifier truncated from '{project_name}_deployment' to '{first}' (max_length=63)"
+        ) == 2
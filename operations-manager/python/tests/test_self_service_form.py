@@ -0,0 +1,51 @@
+"""
+Test the size limit on self-service form submissions.
+"""
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from opi.web import router
+from opi.web.router import web_router
+
+
+@pytest.fixture
+def client():
+    """Client for the web routes with a signed-in user."""
+    app = FastAPI()
+
+    @app.middleware("http")
+    async def sign_in(request: Request, call_next):
+        request.state.user = {"email": "user@example.com"}
+        return await call_next(request)
+
+    app.include_router(web_router)
+    return TestClient(app)
+
+
+def _chunked(body: bytes, chunk_size: int = 64 * 1024):
+    """Yield the body in chunks so the client sends it without a Content-Length."""
+    for start in range(0, len(body), chunk_size):
+        yield body[start : start + chunk_size]
+
+
+class TestFormSizeLimit:
+    """Test that oversized form bodies are refused before they are buffered."""
+
+    body = b"display-name=" + b"a" * router._MAX_FORM_BODY_BYTES
+
+    def test_declared_length_over_limit(self, client):
+        """A body whose Content-Length exceeds the limit is refused."""
+        response = client.post(
+            "/projects/new", content=self.body, headers={"Content-Type": "application/x-www-form-urlencoded"}
+        )
+
+        assert response.status_code == 413
+
+    def test_chunked_body_over_limit(self, client):
+        """A chunked body without Content-Length is counted as it arrives and refused."""
+        response = client.post(
+            "/projects/new", content=_chunked(self.body), headers={"Content-Type": "application/x-www-form-urlencoded"}
+        )
+
+        assert response.status_code == 413
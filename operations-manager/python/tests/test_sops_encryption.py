@@ -0,0 +1,115 @@
+"""
+Test SOPS file encryption and AGE key generation.
+"""
+
+import os
+import stat
+
+import pytest
+from cryptography.hazmat.primitives.asymmetric.x25519 import X25519PrivateKey
+from opi.utils.sops import (
+    _bech32_encode,
+    encrypt_to_sops_files,
+    encrypt_to_sops_files_async,
+    generate_sops_key_pair,
+)
+
+# Stand-in for sops: writes part of its output before failing on files with "bad" in their name
+FAKE_SOPS = """#!/bin/sh
+echo "encrypted-with: $3"
+case "$4" in *bad*) echo "sops failed for $4" >&2; exit 1;; esac
+cat "$4"
+"""
+
+
+@pytest.fixture
+def fake_sops(tmp_path, monkeypatch):
+    """Put a fake sops executable first on the PATH."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    sops = bin_dir / "sops"
+    sops.write_text(FAKE_SOPS)
+    sops.chmod(sops.stat().st_mode | stat.S_IXUSR)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+
+@pytest.fixture
+def secrets_dir(tmp_path):
+    """Directory for the files to encrypt."""
+    directory = tmp_path / "secrets"
+    directory.mkdir()
+    return directory
+
+
+class TestEncryptToSopsFiles:
+    """Test encrypting .to-sops.yaml files into .sops.yaml files."""
+
+    def test_encrypts_and_removes_originals(self, fake_sops, secrets_dir):
+        """Each .to-sops.yaml file is replaced by its encrypted .sops.yaml file."""
+        (secrets_dir / "db.to-sops.yaml").write_text("password: secret\n")
+        (secrets_dir / "db.sops.yaml").write_text("old: encrypted\n")
+
+        assert encrypt_to_sops_files(str(secrets_dir), "age1key") is True
+
+        assert sorted(os.listdir(secrets_dir)) == ["db.sops.yaml"]
+        assert (secrets_dir / "db.sops.yaml").read_text() == "encrypted-with: age1key\npassword: secret\n"
+        assert stat.S_IMODE((secrets_dir / "db.sops.yaml").stat().st_mode) == 0o644
+
+    def test_failure_keeps_existing_output(self, fake_sops, secrets_dir):
+        """A failing sops run leaves an existing .sops.yaml file and the original untouched."""
+        (secrets_dir / "bad.to-sops.yaml").write_text("password: new\n")
+        (secrets_dir / "bad.sops.yaml").write_text("old: encrypted\n")
+
+        assert encrypt_to_sops_files(str(secrets_dir), "age1key") is False
+
+        assert sorted(os.listdir(secrets_dir)) == ["bad.sops.yaml", "bad.to-sops.yaml"]
+        assert (secrets_dir / "bad.sops.yaml").read_text() == "old: encrypted\n"
+        assert (secrets_dir / "bad.to-sops.yaml").read_text() == "password: new\n"
+
+    @pytest.mark.asyncio
+    async def test_async_failure_keeps_existing_output(self, fake_sops, secrets_dir):
+        """The async variant also leaves existing output alone and cleans up its temporary files."""
+        (secrets_dir / "bad.to-sops.yaml").write_text("password: new\n")
+        (secrets_dir / "bad.sops.yaml").write_text("old: encrypted\n")
+
+        assert await encrypt_to_sops_files_async(str(secrets_dir), "age1key") is False
+
+        assert sorted(os.listdir(secrets_dir)) == ["bad.sops.yaml", "bad.to-sops.yaml"]
+        assert (secrets_dir / "bad.sops.yaml").read_text() == "old: encrypted\n"
+
+    @pytest.mark.asyncio
+    async def test_async_encrypts_and_removes_originals(self, fake_sops, secrets_dir):
+        """The async variant replaces each .to-sops.yaml file by its .sops.yaml file."""
+        (secrets_dir / "app.to-sops.yaml").write_text("token: abc\n")
+        (secrets_dir / "db.to-sops.yaml").write_text("password: secret\n")
+
+        assert await encrypt_to_sops_files_async(str(secrets_dir), "age1key") is True
+
+        assert sorted(os.listdir(secrets_dir)) == ["app.sops.yaml", "db.sops.yaml"]
+        assert (secrets_dir / "app.sops.yaml").read_text() == "encrypted-with: age1key\ntoken: abc\n"
+
+    def test_missing_directory(self, tmp_path):
+        """A directory that does not exist has nothing to encrypt."""
+        assert encrypt_to_sops_files(str(tmp_path / "missing"), "age1key") is True
+
+
+class TestSopsKeyGeneration:
+    """Test in-process AGE key generation."""
+
+    def test_bech32_matches_age_test_vector(self):
+        """The encoding matches age's keys for the X25519 scalar 0x42 * 32."""
+        identity = X25519PrivateKey.from_private_bytes(b"\x42" * 32)
+
+        private_key = _bech32_encode("age-secret-key-", identity.private_bytes_raw()).upper()
+        public_key = _bech32_encode("age", identity.public_key().public_bytes_raw())
+
+        assert private_key == "AGE-SECRET-KEY-1GFPYYSJZGFPYYSJZGFPYYSJZGFPYYSJZGFPYYSJZGFPYYSJZGFPQ4EGAEX"
+        assert public_key == "age1zvkyg2lqzraa2lnjvqej32nkuu0ues2s82hzrye869xeexvn73equnujwj"
+
+    def test_generate_sops_key_pair(self):
+        """Generated keys have age's format and differ per call."""
+        private_key, public_key = generate_sops_key_pair()
+
+        assert private_key.startswith("AGE-SECRET-KEY-1") and len(private_key) == 74
+        assert public_key.startswith("age1") and len(public_key) == 62
+        assert generate_sops_key_pair() != (private_key, public_key)
@@ -0,0 +1,134 @@
+"""
+Test the project creation task tracking used by the progress page.
+"""
+
+import pytest
+from opi.core import task_manager
+from opi.core.task_manager import TaskStatus
+
+
+@pytest.fixture
+def project_id():
+    """Create a tracked project and drop it from the in-memory stores afterwards."""
+    project_id = task_manager.create_task("Test project")
+    yield project_id
+    task_manager._projects.pop(project_id, None)
+    task_manager._project_managers.pop(project_id, None)
+    task_manager._project_listeners.pop(project_id, None)
+
+
+class TestProjectChangeNotification:
+    """Test that progress streams are woken up on project changes."""
+
+    @pytest.mark.asyncio
+    async def test_status_assignment_wakes_listener(self, project_id):
+        """Assigning a ProjectInfo field sets the event of a waiting listener."""
+        event = task_manager.watch_project(project_id)
+        assert not event.is_set()
+
+        task_manager.get_task(project_id).status = TaskStatus.COMPLETED
+
+        assert event.is_set()
+        task_manager.unwatch_project(project_id, event)
+
+    @pytest.mark.asyncio
+    async def test_task_changes_wake_listener(self, project_id):
+        """Completing or failing a task of the project sets the event."""
+        manager = task_manager.TaskProgressManager(project_id, "Test project")
+        first = manager.add_task("first")
+        second = manager.add_task("second")
+
+        event = task_manager.watch_project(project_id)
+        manager.complete_task(first)
+        assert event.is_set()
+
+        event.clear()
+        manager.fail_task(second, "failed")
+        assert event.is_set()
+
+        event.clear()
+        task_manager.fail_task(project_id, "failed")
+        assert event.is_set()
+        task_manager.unwatch_project(project_id, event)
+
+    @pytest.mark.asyncio
+    async def test_unwatch_removes_listener(self, project_id):
+        """An unwatched event is no longer set, and the last listener removes the project entry."""
+        event = task_manager.watch_project(project_id)
+        task_manager.unwatch_project(project_id, event)
+
+        task_manager.complete_task(project_id, {})
+
+        assert not event.is_set()
+        assert project_id not in task_manager._project_listeners
+
+
+def _recompute_hierarchy(manager):
+    """Build the progress page hierarchy from scratch, the way the status endpoint used to."""
+    entries = {
+        task.id: {
+            "id": task.id,
+            "name": task.name,
+            "status": task.status.value,
+            "created_at": task.created_at.isoformat(),
+            "completed_at": task.completed_at.isoformat() if task.completed_at else None,
+            "error": task.error,
+        }
+        for task in manager.tasks.values()
+    }
+    hierarchy = [{**entries[task.id], "subtasks": []} for task in manager.tasks.values() if task.parent_id is None]
+    main_tasks = {entry["id"]: entry for entry in hierarchy}
+    for task in manager.tasks.values():
+        if task.parent_id in main_tasks:
+            main_tasks[task.parent_id]["subtasks"].append(entries[task.id])
+    return hierarchy
+
+
+class TestTaskHierarchy:
+    """Test the incrementally maintained task hierarchy and progress."""
+
+    def assert_matches_recomputation(self, manager):
+        completed = sum(1 for task in manager.tasks.values() if task.status == TaskStatus.COMPLETED)
+        assert manager.hierarchy_snapshot() == _recompute_hierarchy(manager)
+        assert manager._completed_count == completed
+        assert manager.progress_percent() == int(completed / len(manager.tasks) * 100)
+
+    def test_hierarchy_follows_task_changes(self, project_id):
+        """The snapshot and completed count match a full recomputation after every change."""
+        manager = task_manager.TaskProgressManager(project_id, "Test project")
+        assert manager.hierarchy_snapshot() == []
+        assert manager.progress_percent() == 0
+
+        validate = manager.add_task("validate")
+        deploy = manager.add_task("deploy")
+        database = manager.add_subtask(deploy, "database")
+        manager.add_subtask(database, "nested")  # subtasks of subtasks are not shown
+        manager.add_subtask("unknown", "orphan")
+        self.assert_matches_recomputation(manager)
+
+        manager.complete_task(validate)
+        self.assert_matches_recomputation(manager)
+
+        manager.complete_task(validate)  # completing twice counts once
+        self.assert_matches_recomputation(manager)
+
+        manager.complete_task(database)
+        manager.fail_task(deploy, "deployment failed")
+        self.assert_matches_recomputation(manager)
+
+        manager.fail_task(validate, "rolled back")  # a completed task that fails no longer counts
+        self.assert_matches_recomputation(manager)
+
+        manager.complete_task(deploy)
+        self.assert_matches_recomputation(manager)
+        assert manager.hierarchy_snapshot()[1]["subtasks"][0]["status"] == "completed"
+
+    def test_project_completion(self, project_id):
+        """Completing the project through the module functions updates its status and step."""
+        task_manager.TaskProgressManager(project_id, "Test project")
+
+        task_manager.complete_task(project_id, {})
+
+        project = task_manager.get_task(project_id)
+        assert project.status == TaskStatus.COMPLETED
+        assert project.current_step == "Completed"